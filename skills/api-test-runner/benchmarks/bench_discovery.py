@@ -0,0 +1,177 @@
+import argparse
+import json
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "..", "src"))
+sys.path.insert(0, HERE)
+
+from api_test_runner.cache import open_cache  # noqa: E402
+from api_test_runner.cli import build_plan  # noqa: E402
+from api_test_runner.discovery import discover_endpoints, discover_env  # noqa: E402
+from api_test_runner.discovery.endpoints import cache_version, default_jobs  # noqa: E402
+from api_test_runner.inventory import build_inventory  # noqa: E402
+from api_test_runner.planning import infer_order  # noqa: E402
+from synth import SIZES, generate_project  # noqa: E402
+
+RESULTS_PATH = os.path.join(HERE, "results", "discovery.jsonl")
+STAGES = ["inventory", "discover_env", "discover_endpoints", "discover_endpoints_parallel", "discover_endpoints_cached", "plan"]
+
+
+def peak_rss_kb() -> int:
+    usage = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    return usage // 1024 if sys.platform == "darwin" else usage
+
+
+def stage_runner(stage: str, project: str, jobs: int) -> Callable[[], int]:
+    inventory = build_inventory(project)
+    if stage == "inventory":
+        return lambda: len(build_inventory(project).entries)
+    if stage == "discover_env":
+        return lambda: len(discover_env(project, inventory)["env_files"])
+    if stage == "discover_endpoints":
+        return lambda: len(discover_endpoints(project, inventory, None, 1))
+    if stage == "discover_endpoints_parallel":
+        return lambda: len(discover_endpoints(project, inventory, None, jobs))
+    if stage == "discover_endpoints_cached":
+        warm = open_cache(project, cache_version())
+        discover_endpoints(project, inventory, warm, 1)
+        warm.save(inventory)
+        return lambda: len(discover_endpoints(project, inventory, open_cache(project, cache_version()), 1))
+    if stage == "plan":
+        endpoints = discover_endpoints(project, inventory, None, jobs)
+        return lambda: len(build_plan(infer_order(endpoints, {}), {}))
+    raise ValueError(f"unknown stage: {stage}")
+
+
+def run_stage(stage: str, project: str, repeat: int, jobs: int) -> Dict:
+    inventory = build_inventory(project)
+    work = stage_runner(stage, project, jobs)
+    timings: List[float] = []
+    items = 0
+    for _ in range(repeat):
+        began = time.perf_counter()
+        items = work()
+        timings.append(time.perf_counter() - began)
+    best = min(timings)
+    files = len(inventory.entries)
+    return {
+        "stage": stage,
+        "wall_ms": round(best * 1000, 3),
+        "mean_ms": round(sum(timings) / len(timings) * 1000, 3),
+        "items": items,
+        "files": files,
+        "files_per_sec": round(files / best, 1) if best else None,
+        "peak_rss_kb": peak_rss_kb(),
+    }
+
+
+def git_revision() -> Optional[str]:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=HERE, capture_output=True, text=True, check=False)
+    except OSError:
+        return None
+    return out.stdout.strip() or None
+
+
+def load_results(path: str) -> List[Dict]:
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            return [json.loads(line) for line in handle if line.strip()]
+    except OSError:
+        return []
+
+
+def print_table(record: Dict, previous: Optional[Dict]) -> None:
+    before = {item["stage"]: item for item in (previous or {}).get("stages", [])}
+    print(f"{'Stage':<30} {'Wall (ms)':>10} {'Files/s':>10} {'RSS (MB)':>9} {'vs prev':>8}")
+    for item in record["stages"]:
+        delta = ""
+        if item["stage"] in before and before[item["stage"]]["wall_ms"]:
+            delta = f"{(item['wall_ms'] / before[item['stage']]['wall_ms'] - 1) * 100:+.1f}%"
+        print(
+            f"{item['stage']:<30} {item['wall_ms']:>10.1f} {item['files_per_sec'] or 0:>10.0f} "
+            f"{item['peak_rss_kb'] / 1024:>9.1f} {delta:>8}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="bench_discovery")
+    parser.add_argument("--size", choices=sorted(SIZES), default="small")
+    for key in SIZES["small"]:
+        parser.add_argument(f"--{key.replace('_', '-')}", dest=key, type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--jobs", type=int, default=default_jobs())
+    parser.add_argument("--stages", default=",".join(STAGES))
+    parser.add_argument("--project-dir")
+    parser.add_argument("--results", default=RESULTS_PATH)
+    parser.add_argument("--no-save", action="store_true")
+    parser.add_argument("--worker")
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_stage(args.worker, args.project_dir, args.repeat, args.jobs)))
+        return 0
+
+    sizes = dict(SIZES[args.size])
+    for key in sizes:
+        if getattr(args, key) is not None:
+            sizes[key] = getattr(args, key)
+    project = args.project_dir or tempfile.mkdtemp(prefix="bench-project-")
+    began = time.perf_counter()
+    manifest = generate_project(project, sizes, args.seed)
+    print(f"Generated {args.size} project in {time.perf_counter() - began:.1f}s: {project}")
+
+    stages = []
+    for stage in [name for name in args.stages.split(",") if name]:
+        out = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--worker", stage, "--project-dir", project,
+             "--repeat", str(args.repeat), "--jobs", str(args.jobs)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        stages.append(json.loads(out.stdout.strip().splitlines()[-1]))
+
+    found = next((item["items"] for item in stages if item["stage"] == "discover_endpoints"), None)
+    if found is not None and found != manifest["expected_endpoints"]:
+        print(f"warning: discovered {found} endpoints, expected {manifest['expected_endpoints']}")
+
+    record = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "size": args.size,
+        "sizes": sizes,
+        "seed": args.seed,
+        "jobs": args.jobs,
+        "repeat": args.repeat,
+        "stages": stages,
+    }
+    history = [item for item in load_results(args.results) if item.get("sizes") == sizes]
+    print_table(record, history[-1] if history else None)
+    if not args.no_save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.results)), exist_ok=True)
+        with open(args.results, "a", encoding="utf-8") as handle:
+            handle.write(json.dumps(record) + "\n")
+        print("Results appended to", args.results)
+    if not args.project_dir:
+        shutil.rmtree(project, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+import json
+import os
+import random
+from typing import Dict
+
+SIZES: Dict[str, Dict[str, int]] = {
+    "small": {
+        "spring": 50,
+        "nest": 50,
+        "express": 50,
+        "noise": 200,
+        "openapi": 200,
+        "node_modules": 2000,
+        "node_modules_depth": 4,
+        "env": 10,
+    },
+    "medium": {
+        "spring": 500,
+        "nest": 500,
+        "express": 500,
+        "noise": 2000,
+        "openapi": 1000,
+        "node_modules": 20000,
+        "node_modules_depth": 6,
+        "env": 50,
+    },
+    "large": {
+        "spring": 2000,
+        "nest": 2000,
+        "express": 2000,
+        "noise": 8000,
+        "openapi": 5000,
+        "node_modules": 50000,
+        "node_modules_depth": 8,
+        "env": 200,
+    },
+}
+
+SERVICES = 8
+FILES_PER_DIR = 200
+
+
+def write(root: str, relpath: str, text: str) -> None:
+    path = os.path.join(root, relpath)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.write(text)
+
+
+def filler(rng: random.Random, lines: int, comment: str) -> str:
+    return "".join(f"{comment} {rng.getrandbits(64):016x} helper line {i}\n" for i in range(rng.randint(lines // 2, lines)))
+
+
+def spring_controller(rng: random.Random, index: int) -> str:
+    name = f"Resource{index}"
+    return (
+        "package com.example.api;\n\n"
+        "import org.springframework.web.bind.annotation.*;\n\n"
+        "@RestController\n"
+        f"public class {name}Controller {{\n"
+        + filler(rng, 40, "    //")
+        + f'    @GetMapping("/spring/r{index}")\n    public String list() {{ return "[]"; }}\n'
+        + f'    @GetMapping("/spring/r{index}/{{id}}")\n    public String get() {{ return "{{}}"; }}\n'
+        + f'    @PostMapping("/spring/r{index}")\n    public String create() {{ return "{{}}"; }}\n'
+        + f'    @PutMapping("/spring/r{index}/{{id}}")\n    public String update() {{ return "{{}}"; }}\n'
+        + "}\n"
+    )
+
+
+def nest_controller(rng: random.Random, index: int) -> str:
+    return (
+        "import { Controller, Get, Post, Put, Delete } from '@nestjs/common';\n\n"
+        f"@Controller('nest/r{index}')\n"
+        f"export class Resource{index}Controller {{\n"
+        + filler(rng, 40, "  //")
+        + "  @Get()\n  list() { return []; }\n"
+        + "  @Get(':id')\n  get() { return {}; }\n"
+        + "  @Post()\n  create() { return {}; }\n"
+        + "  @Put(':id')\n  update() { return {}; }\n"
+        + "  @Delete(':id')\n  remove() { return {}; }\n"
+        + "}\n"
+    )
+
+
+def express_router(rng: random.Random, index: int) -> str:
+    return (
+        "const router = require('express').Router();\n"
+        + filler(rng, 40, "//")
+        + f"router.get('/express/r{index}', (req, res) => res.json([]));\n"
+        + f"router.get('/express/r{index}/:id', (req, res) => res.json({{}}));\n"
+        + f"router.post('/express/r{index}', (req, res) => res.json({{}}));\n"
+        + "module.exports = router;\n"
+    )
+
+
+def openapi_spec(count: int) -> str:
+    paths = {}
+    for index in range(count):
+        schema = {"$ref": f"#/components/schemas/Model{index}"}
+        paths[f"/openapi/r{index}"] = {
+            "get": {"responses": {"200": {"description": "ok"}}},
+            "post": {
+                "requestBody": {"content": {"application/json": {"schema": schema}}},
+                "responses": {"201": {"description": "created"}},
+            },
+        }
+        paths[f"/openapi/r{index}/{{id}}"] = {"get": {"responses": {"200": {"description": "ok"}}}}
+    schemas = {
+        f"Model{index}": {
+            "type": "object",
+            "required": ["name"],
+            "properties": {"name": {"type": "string"}, "size": {"type": "integer"}},
+        }
+        for index in range(count)
+    }
+    spec = {"openapi": "3.0.0", "info": {"title": "synthetic", "version": "1"}, "paths": paths}
+    spec["components"] = {"schemas": schemas}
+    return json.dumps(spec, indent=2)
+
+
+def generate_project(root: str, sizes: Dict[str, int], seed: int = 0) -> Dict:
+    rng = random.Random(seed)
+    expected = 0
+    for index in range(sizes.get("spring", 0)):
+        service = f"svc{index % SERVICES}"
+        write(root, f"services/{service}/src/main/java/com/example/api/Resource{index}Controller.java", spring_controller(rng, index))
+        expected += 4
+    for index in range(sizes.get("nest", 0)):
+        write(root, f"apps/nest/src/r{index // FILES_PER_DIR}/r{index}.controller.ts", nest_controller(rng, index))
+        expected += 5
+    for index in range(sizes.get("express", 0)):
+        write(root, f"apps/express/routes/g{index // FILES_PER_DIR}/r{index}.js", express_router(rng, index))
+        expected += 3
+    for index in range(sizes.get("noise", 0)):
+        write(root, f"libs/shared/m{index // FILES_PER_DIR}/util{index}.ts", f"export const value{index} = {index};\n" + filler(rng, 60, "//"))
+    if sizes.get("openapi"):
+        write(root, "docs/openapi.json", openapi_spec(sizes["openapi"]))
+        expected += sizes["openapi"] * 3
+
+    depth = max(1, sizes.get("node_modules_depth", 1))
+    for index in range(sizes.get("node_modules", 0)):
+        nested = "/".join(f"node_modules/pkg{(index + level) % 97}" for level in range(index % depth + 1))
+        write(root, f"{nested}/lib/f{index}.js", f"router.get('/vendored/{index}', noop);\n")
+
+    for index in range(sizes.get("env", 0)):
+        service = f"services/svc{index % SERVICES}/config{index}"
+        if index % 2:
+            write(root, f"{service}/application.properties", f"server.port={8000 + index}\nspring.datasource.url=jdbc:postgresql://db:5432/app{index}\n")
+        else:
+            write(root, f"{service}/.env", f"PORT={8000 + index}\nDATABASE_URL=postgres://user:pw@db:5432/app{index}\nAPI_KEY=k{index}\n")
+
+    manifest = {"seed": seed, "sizes": sizes, "expected_endpoints": expected}
+    write(root, "bench-manifest.json", json.dumps(manifest, indent=2))
+    return manifest
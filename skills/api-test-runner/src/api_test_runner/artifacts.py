@@ -0,0 +1,82 @@
+import gzip
+import json
+import os
+from typing import Dict, Iterable, Iterator, List, Optional
+
+ARTIFACT_FILE = "requests.jsonl"
+ARTIFACT_FILE_GZIP = "requests.jsonl.gz"
+INDEX_FILE = "requests.index.jsonl"
+
+
+def artifact_file(directory: str) -> Optional[str]:
+    for name in (ARTIFACT_FILE, ARTIFACT_FILE_GZIP):
+        path = os.path.join(directory, name)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def load_index(directory: str) -> Dict[int, Dict]:
+    index: Dict[int, Dict] = {}
+    try:
+        with open(os.path.join(directory, INDEX_FILE), "r", encoding="utf-8") as handle:
+            for line in handle:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break
+                index[entry.get("index")] = entry
+    except OSError:
+        pass
+    return index
+
+
+def read_artifact(directory: str, index: int) -> Optional[Dict]:
+    path = artifact_file(directory)
+    entry = load_index(directory).get(index)
+    if not path or not entry:
+        return None
+    with open(path, "rb") as handle:
+        handle.seek(entry["offset"])
+        data = handle.read(entry["length"])
+    if path.endswith(".gz"):
+        data = gzip.decompress(data)
+    return json.loads(data)
+
+
+def iter_artifacts(directory: str) -> Iterator[Dict]:
+    path = artifact_file(directory)
+    if not path:
+        return
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as handle:
+        try:
+            for line in handle:
+                yield json.loads(line)
+        except (ValueError, EOFError):
+            return
+
+
+def merge_artifacts(sources: Iterable[str], directory: str) -> int:
+    records: Dict[int, Dict] = {}
+    extra: List[Dict] = []
+    for source in sources:
+        for record in iter_artifacts(source):
+            if record.get("index") is None:
+                extra.append(record)
+            else:
+                records.setdefault(record["index"], record)
+    os.makedirs(directory, exist_ok=True)
+    offset = 0
+    with open(os.path.join(directory, ARTIFACT_FILE), "wb") as handle, open(
+        os.path.join(directory, INDEX_FILE), "w", encoding="utf-8"
+    ) as index_handle:
+        for record in [records[key] for key in sorted(records)] + extra:
+            line = (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+            handle.write(line)
+            index_handle.write(json.dumps({"index": record.get("index"), "offset": offset, "length": len(line)}) + "\n")
+            offset += len(line)
+    stale = os.path.join(directory, ARTIFACT_FILE_GZIP)
+    if os.path.exists(stale):
+        os.remove(stale)
+    return len(records) + len(extra)
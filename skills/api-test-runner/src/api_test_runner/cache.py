@@ -0,0 +1,99 @@
+import hashlib
+import json
+import os
+from typing import Any, Dict, Optional
+
+from .inventory import FileEntry, Inventory
+
+CACHE_DIRNAME = ".api-test-runner"
+CACHE_FILENAME = "discovery-cache.json"
+CACHE_VERSION = 1
+
+
+def file_digest(path: str) -> Optional[str]:
+    digest = hashlib.sha1()
+    try:
+        with open(path, "rb") as handle:
+            for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def default_cache_path(project_root: str) -> str:
+    return os.path.join(project_root, CACHE_DIRNAME, CACHE_FILENAME)
+
+
+class DiscoveryCache:
+    def __init__(self, path: str, version: Any = CACHE_VERSION):
+        self.path = path
+        self.version = version
+        self.files: Dict[str, Dict] = {}
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def load(self) -> "DiscoveryCache":
+        try:
+            with open(self.path, "r", encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (OSError, ValueError):
+            return self
+        if isinstance(data, dict) and data.get("version") == self.version:
+            self.files = data.get("files") or {}
+        return self
+
+    def lookup(self, kind: str, entry: Optional[FileEntry]) -> Optional[Any]:
+        if entry is None:
+            return None
+        record = self.files.get(entry.path)
+        if not record or kind not in record.get("results", {}):
+            self.misses += 1
+            return None
+        if record.get("mtime") == entry.mtime and record.get("size") == entry.size:
+            self.hits += 1
+            return record["results"][kind]
+        if record.get("size") == entry.size and record.get("hash"):
+            if file_digest(entry.path) == record["hash"]:
+                record["mtime"] = entry.mtime
+                self.dirty = True
+                self.hits += 1
+                return record["results"][kind]
+        self.misses += 1
+        return None
+
+    def store(self, kind: str, entry: Optional[FileEntry], value: Any) -> None:
+        if entry is None:
+            return
+        record = self.files.get(entry.path)
+        if not record or record.get("mtime") != entry.mtime or record.get("size") != entry.size:
+            record = {
+                "mtime": entry.mtime,
+                "size": entry.size,
+                "hash": file_digest(entry.path),
+                "results": {},
+            }
+            self.files[entry.path] = record
+        record["results"][kind] = value
+        self.dirty = True
+
+    def save(self, inventory: Optional[Inventory] = None) -> None:
+        if inventory is not None:
+            stale = [path for path in self.files if inventory.get(path) is None]
+            for path in stale:
+                del self.files[path]
+            if stale:
+                self.dirty = True
+        if not self.dirty:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump({"version": self.version, "files": self.files}, handle, separators=(",", ":"))
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+
+def open_cache(project_root: str, version: Any = CACHE_VERSION) -> DiscoveryCache:
+    return DiscoveryCache(default_cache_path(project_root), version).load()
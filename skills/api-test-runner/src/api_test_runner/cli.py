@@ -1,22 +1,79 @@
 import argparse
+import cProfile
+import glob
 import json
 import os
-from typing import Dict, List
+import pstats
+import time
+from typing import Callable, Dict, List, Optional
 
+from .artifacts import merge_artifacts
+from .cache import open_cache
 from .config import resolve_config
-from .discovery import detect_backend, detect_db_clis, detect_db_engine, discover_endpoints, discover_env
-from .execution import run_runner
+from .discovery import (
+    OpenApiIndex,
+    detect_backend,
+    detect_db_clis,
+    detect_db_engine,
+    discover_endpoints,
+    discover_env,
+    example_payload,
+    load_openapi_indexes,
+)
+from .discovery.endpoints import cache_version, default_jobs
+from .execution import BackendProcess, BackendStartError, Engine, infer_start_command, resolve_health_path, run_runner
+from .execution.lifecycle import write_lifecycle
 from .generation import detect_runtime, generate_runner
-from .planning import infer_order
+from .generation.fingerprint import compute_fingerprint, fingerprint_matches, save_fingerprint
+from .generation.runner import load_plan, plan_path_for, runner_path_for
+from .inventory import Inventory, build_inventory, resolve_prune_dirs
+from .planning import (
+    compile_path,
+    infer_order,
+    is_auth_path,
+    is_health_path,
+    load_latencies,
+    parse_shard,
+    resource_base,
+    shard_label,
+    shard_plan,
+)
+from .profiling import PSTATS_FILE, Profiler, activate, count, stage
+from .reporting import (
+    compare_samples,
+    format_compare_markdown,
+    journal_path_for,
+    lifecycle_path_for,
+    list_baselines,
+    merge_results,
+    merge_samples,
+    rebuild_reports,
+    save_baseline,
+    write_merged_report,
+)
+from .reporting.baseline import (
+    DEFAULT_ALPHA,
+    DEFAULT_KEEP,
+    DEFAULT_SAMPLES,
+    DEFAULT_THRESHOLD_MS,
+    DEFAULT_THRESHOLD_PCT,
+    baseline_dir_for,
+    load_report,
+)
 from .util import redact_dict
+from .watch import DEFAULT_INTERVAL, SourceMap, Watcher, format_cycle
 
 
-def build_plan(endpoints: List[Dict], config: Dict) -> List[Dict]:
+def build_plan(endpoints: List[Dict], config: Dict, openapi: Optional[List[OpenApiIndex]] = None) -> List[Dict]:
     plan = []
     auth = config.get("auth") or {}
     for ep in endpoints:
         entry = dict(ep)
         method = entry.get("method", "GET")
+        path = entry.get("path", "")
+        entry["group"] = resource_base(path)
+        entry["compiled_path"] = compile_path(path)
+        entry["setup"] = is_health_path(path) or is_auth_path(path)
         if method in {"POST", "PUT", "PATCH"}:
             if auth and entry.get("path") == auth.get("loginEndpoint"):
                 payload = auth.get("payload")
@@ -27,8 +84,14 @@ def build_plan(endpoints: List[Dict], config: Dict) -> List[Dict]:
                 entry["payload"] = payload
                 entry["payload_guess"] = not bool(payload)
             else:
-                entry["payload"] = config.get("defaultPayload", {})
-                entry["payload_guess"] = True
+                payload = example_payload(openapi or [], method, path)
+                if payload is not None:
+                    entry["payload"] = payload
+                    entry["payload_guess"] = False
+                    entry["payload_source"] = "openapi"
+                else:
+                    entry["payload"] = config.get("defaultPayload", {})
+                    entry["payload_guess"] = True
         plan.append(entry)
     return plan
 
@@ -47,13 +110,35 @@ def detect_auth(endpoints: List[Dict], config: Dict) -> None:
             return
 
 
-def gather_discovery(project_root: str, config: Dict) -> Dict:
-    env_data = discover_env(project_root)
-    backend = detect_backend(project_root)
-    endpoints = discover_endpoints(project_root)
+def gather_discovery(
+    project_root: str,
+    config: Dict,
+    use_cache: bool = True,
+    jobs: int = 1,
+    inventory: Optional[Inventory] = None,
+) -> Dict:
+    if inventory is None:
+        with stage("inventory"):
+            inventory = build_inventory(project_root, resolve_prune_dirs(config))
+    with stage("cache.load"):
+        cache = open_cache(project_root, cache_version()) if use_cache else None
+    with stage("discover_env"):
+        env_data = discover_env(project_root, inventory, cache)
+    with stage("detect_backend"):
+        backend = detect_backend(project_root)
+    with stage("discover_endpoints"):
+        endpoints = discover_endpoints(project_root, inventory, cache, jobs)
+    with stage("openapi_index"):
+        openapi = load_openapi_indexes(project_root, inventory, cache)
+    if cache:
+        with stage("cache.save"):
+            cache.save(inventory)
+        count("cache_hits", cache.hits)
+        count("cache_misses", cache.misses)
     db_info = env_data.get("db", {})
     db_engine = detect_db_engine(db_info)
-    db_clis = detect_db_clis()
+    with stage("detect_db_clis"):
+        db_clis = detect_db_clis()
 
     base_url = config.get("baseUrl") or env_data.get("base_url") or "http://localhost:8080"
 
@@ -61,6 +146,7 @@ def gather_discovery(project_root: str, config: Dict) -> Dict:
         "backend": backend,
         "env": env_data,
         "endpoints": endpoints,
+        "openapi": openapi,
         "db": db_info,
         "db_engine": db_engine,
         "db_clis": db_clis,
@@ -76,6 +162,133 @@ def print_discovery(summary: Dict) -> None:
     print("DB CLIs:", ", ".join(summary.get("db_clis") or []) or "none")
 
 
+def rebuild_report(project_root: str, report_path: Optional[str], journal: Optional[str]) -> int:
+    report_path = report_path or os.path.join(project_root, "reports", "api-test-report.md")
+    journal = journal or journal_path_for(report_path)
+    if not os.path.exists(journal):
+        print("No journal found:", journal)
+        return 1
+    count = rebuild_reports(journal, report_path)
+    print(f"Rebuilt report from {count} journal entries:", report_path)
+    return 0
+
+
+def json_report_for(report_path: str) -> str:
+    return report_path[:-3] + ".json" if report_path.endswith(".md") else report_path + ".json"
+
+
+def compare_reports(project_root: str, args: argparse.Namespace) -> int:
+    config = resolve_config(project_root, args.config)
+    settings = config.get("baseline") or {}
+    report_path = args.report_path or os.path.join(project_root, "reports", "api-test-report.md")
+    current_path = report_path if report_path.endswith(".json") else json_report_for(report_path)
+    if not os.path.exists(current_path):
+        print("No report found:", current_path)
+        return 1
+    store = baseline_dir_for(project_root, config)
+    if args.baseline and os.path.isfile(args.baseline):
+        baselines = [args.baseline]
+    else:
+        samples = args.samples or int(settings.get("samples") or DEFAULT_SAMPLES)
+        baselines = list_baselines(args.baseline or store)[-samples:]
+
+    code = 0
+    if not baselines:
+        print("No baseline reports in", args.baseline or store)
+    else:
+        rows = compare_samples(
+            merge_samples([load_report(path) for path in baselines]),
+            merge_samples([load_report(current_path)]),
+            threshold_pct=args.threshold_pct if args.threshold_pct is not None else float(settings.get("thresholdPct", DEFAULT_THRESHOLD_PCT)),
+            threshold_ms=args.threshold_ms if args.threshold_ms is not None else float(settings.get("thresholdMs", DEFAULT_THRESHOLD_MS)),
+            alpha=float(settings.get("alpha", DEFAULT_ALPHA)),
+        )
+        compare_path = os.path.join(os.path.dirname(current_path), "api-test-compare.md")
+        markdown = format_compare_markdown(rows, baselines)
+        with open(compare_path, "w", encoding="utf-8") as handle:
+            handle.write(markdown)
+        with open(compare_path[:-3] + ".json", "w", encoding="utf-8") as handle:
+            json.dump({"baselines": baselines, "endpoints": rows}, handle, indent=2)
+        print(markdown)
+        regressions = [row for row in rows if row["status"] == "regression"]
+        if regressions:
+            print(f"Latency regressions: {len(regressions)}")
+            code = 1
+        else:
+            print("No latency regressions")
+    if args.save:
+        print("Saved baseline:", save_baseline(store, current_path, int(settings.get("keep") or DEFAULT_KEEP)))
+    return code
+
+
+def shard_report_path(path: str) -> str:
+    if os.path.isdir(path):
+        return os.path.join(path, "api-test-report.json")
+    return json_report_for(path) if path.endswith(".md") else path
+
+
+def merge_shards(project_root: str, args: argparse.Namespace) -> int:
+    shards_dir = os.path.join(project_root, "reports", "shards")
+    inputs = args.inputs or sorted(glob.glob(os.path.join(shards_dir, "*", "api-test-report.json")))
+    paths = [shard_report_path(path) for path in inputs]
+    missing = [path for path in paths if not os.path.exists(path)]
+    if not paths or missing:
+        print("No shard reports found:", ", ".join(missing) or shards_dir)
+        return 1
+    report_path = args.report_path or os.path.join(project_root, "reports", "api-test-report.md")
+    lifecycle_path = lifecycle_path_for(report_path)
+    if os.path.exists(lifecycle_path):
+        os.remove(lifecycle_path)
+    count = write_merged_report(merge_results(load_report(path) for path in paths), report_path)
+    print(f"Merged {count} results from {len(paths)} shard reports:", report_path)
+
+    sources = args.artifacts or sorted(glob.glob(os.path.join(project_root, "artifacts", "shards", "*")))
+    sources = [path for path in sources if os.path.isdir(path)]
+    if sources:
+        artifacts_dir = args.artifacts_dir or os.path.join(project_root, "artifacts")
+        print(f"Merged {merge_artifacts(sources, artifacts_dir)} artifacts from {len(sources)} shards:", artifacts_dir)
+    return 0
+
+
+def watch_project(project_root: str, args: argparse.Namespace) -> int:
+    config = resolve_config(project_root, args.config)
+    if args.base_url:
+        config["baseUrl"] = args.base_url
+    prune = resolve_prune_dirs(config)
+    inventory = build_inventory(project_root, prune)
+    cache = open_cache(project_root, cache_version()) if not args.no_cache else None
+    env_data = discover_env(project_root, inventory, cache)
+    source_map = SourceMap(project_root, prune)
+    files = source_map.load(inventory, cache)
+    if cache:
+        cache.save(inventory)
+    detect_auth(source_map.endpoints(), config)
+
+    payload_config = dict(config, db={}, dbClis={}, seedSql=None, seedFile=None, seedRows=None, inspectDb=False)
+    payload_config["baseUrl"] = config.get("baseUrl") or env_data.get("base_url") or "http://localhost:8080"
+    report_path = args.report_path or os.path.join(project_root, "reports", "api-test-watch.md")
+    artifacts_dir = os.path.join(project_root, "artifacts", "watch")
+    watcher = Watcher(
+        source_map,
+        config,
+        lambda endpoints: build_plan(endpoints, config, source_map.indexes()),
+        lambda plan: Engine(plan, payload_config, report_path, artifacts_dir).run(),
+    )
+    print(f"Watching {len(files)} files ({len(source_map.endpoints())} endpoints); base URL {payload_config['baseUrl']}")
+    summary = watcher.cycle(files)
+    if summary:
+        print(format_cycle(summary, watcher), flush=True)
+    try:
+        while True:
+            time.sleep(args.interval)
+            summary = watcher.cycle()
+            if summary:
+                print(format_cycle(summary, watcher), flush=True)
+    except KeyboardInterrupt:
+        print("Stopped watching.")
+    return 0
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(prog="api-test-runner")
     sub = parser.add_subparsers(dest="command", required=True)
@@ -90,42 +303,176 @@ def main() -> int:
         subparser.add_argument("--only-generate", action="store_true")
         subparser.add_argument("--run", action="store_true")
         subparser.add_argument("--report-path")
+        subparser.add_argument("--no-cache", action="store_true")
+        subparser.add_argument("--jobs", type=int, default=default_jobs())
+        subparser.add_argument("--concurrency", type=int)
+        subparser.add_argument("--force-regenerate", action="store_true")
+        subparser.add_argument("--in-process", action="store_true")
+        subparser.add_argument("--start-backend", action="store_true")
+        subparser.add_argument("--start-command")
+        subparser.add_argument("--profile", action="store_true")
+        subparser.add_argument("--cprofile", action="store_true")
+        subparser.add_argument("--shard")
+        subparser.add_argument("--shard-timings", action="append")
 
     add_common(sub.add_parser("discover"))
     add_common(sub.add_parser("generate"))
     add_common(sub.add_parser("run"))
+    bench_parser = sub.add_parser("bench")
+    add_common(bench_parser)
+    bench_parser.add_argument("--duration", type=float)
+    bench_parser.add_argument("--iterations", type=int)
+    bench_parser.add_argument("--rate", type=float)
+    report_parser = sub.add_parser("report")
+    report_parser.add_argument("--project-root", default=os.getcwd())
+    report_parser.add_argument("--report-path")
+    report_parser.add_argument("--journal")
+
+    compare_parser = sub.add_parser("compare")
+    compare_parser.add_argument("--project-root", default=os.getcwd())
+    compare_parser.add_argument("--config")
+    compare_parser.add_argument("--report-path")
+    compare_parser.add_argument("--baseline")
+    compare_parser.add_argument("--samples", type=int)
+    compare_parser.add_argument("--threshold-pct", type=float)
+    compare_parser.add_argument("--threshold-ms", type=float)
+    compare_parser.add_argument("--save", action="store_true")
+
+    watch_parser = sub.add_parser("watch")
+    watch_parser.add_argument("--project-root", default=os.getcwd())
+    watch_parser.add_argument("--base-url", dest="base_url")
+    watch_parser.add_argument("--config")
+    watch_parser.add_argument("--report-path")
+    watch_parser.add_argument("--no-cache", action="store_true")
+    watch_parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL)
+
+    merge_parser = sub.add_parser("merge")
+    merge_parser.add_argument("--project-root", default=os.getcwd())
+    merge_parser.add_argument("--report-path")
+    merge_parser.add_argument("--artifacts", action="append")
+    merge_parser.add_argument("--artifacts-dir")
+    merge_parser.add_argument("inputs", nargs="*")
 
     args = parser.parse_args()
     project_root = os.path.abspath(args.project_root)
+    if args.command == "report":
+        return rebuild_report(project_root, args.report_path, args.journal)
+    if args.command == "compare":
+        return compare_reports(project_root, args)
+    if args.command == "merge":
+        return merge_shards(project_root, args)
+    if args.command == "watch":
+        return watch_project(project_root, args)
+    if args.shard:
+        try:
+            args.shard = parse_shard(args.shard)
+        except ValueError as exc:
+            parser.error(str(exc))
+    if args.profile or args.cprofile:
+        return profile_pipeline(args, project_root)
+    return run_pipeline(args, project_root)
+
+
+def profile_pipeline(args: argparse.Namespace, project_root: str) -> int:
+    profiler = Profiler()
+    activate(profiler)
+    profile = cProfile.Profile() if args.cprofile else None
+    if profile:
+        profile.enable()
+    try:
+        return run_pipeline(args, project_root)
+    finally:
+        if profile:
+            profile.disable()
+        activate(None)
+        directory = os.path.join(project_root, ".api-test-runner")
+        paths = profiler.write(directory)
+        print(profiler.summary())
+        print("Profile trace:", paths["trace"])
+        print("Profile summary:", paths["summary"])
+        if profile:
+            pstats_path = os.path.join(directory, PSTATS_FILE)
+            profile.dump_stats(pstats_path)
+            with open(paths["summary"], "a", encoding="utf-8") as handle:
+                handle.write("\n")
+                pstats.Stats(profile, stream=handle).sort_stats("cumulative").print_stats(25)
+            print("cProfile stats:", pstats_path)
+
+
+def run_pipeline(args: argparse.Namespace, project_root: str) -> int:
     config = resolve_config(project_root, args.config)
     if args.base_url:
         config["baseUrl"] = args.base_url
+    if args.concurrency:
+        config["concurrency"] = args.concurrency
+    if args.start_command:
+        config["start"] = dict(config.get("start") or {}, command=args.start_command)
+    start_backend = args.start_backend or bool((config.get("start") or {}).get("enabled"))
+    if args.command == "bench":
+        bench = dict(config.get("bench") or {})
+        if args.duration is not None:
+            bench["durationSeconds"] = args.duration
+        if args.iterations is not None:
+            bench["iterations"] = args.iterations
+        if args.rate is not None:
+            bench["rate"] = args.rate
+        if args.concurrency:
+            bench["concurrency"] = args.concurrency
+        config["bench"] = bench
 
-    discovery = gather_discovery(project_root, config)
+    runtime = detect_runtime()
+    label = shard_label(*args.shard) if args.shard else ""
+    runner_path = runner_path_for(project_root, runtime, ".shard-" + label if label else "")
+    default_report = os.path.join(project_root, "reports", "api-test-report.md")
+    report_path = args.report_path or (os.path.join(project_root, "reports", "shards", label, "api-test-report.md") if label else default_report)
+    timings = (args.shard_timings or [json_report_for(default_report)]) if label else []
+    executes = args.command in {"run", "bench"} and not (args.dry_run or args.only_generate or args.only_discovery)
+
+    with stage("inventory"):
+        inventory = build_inventory(project_root, resolve_prune_dirs(config))
+    fingerprint = None
+    if args.command != "discover" and not args.only_discovery:
+        options = {"no_db": args.no_db, "report_path": report_path}
+        if label:
+            options["shard"] = label
+            options["shard_timings"] = [[path, os.path.getmtime(path)] for path in timings if os.path.exists(path)]
+        with stage("fingerprint"):
+            fingerprint = compute_fingerprint(inventory, config, runtime, options)
+        if executes:
+            if not args.force_regenerate and fingerprint_matches(project_root, fingerprint, runner_path):
+                print("Plan cache: hit; reusing", runner_path)
+                header, plan = load_plan(plan_path_for(runner_path))
+                engine = Engine(plan, header.get("config", {}), report_path, header.get("artifacts_dir")) if args.in_process else None
+                base_url = (header.get("config") or {}).get("baseUrl") or "http://localhost:8080"
+                return execute_with_backend(
+                    project_root, config, base_url, plan, report_path, start_backend,
+                    lambda: execute_runner(args.command, runtime, runner_path, engine),
+                )
+            print("Plan cache: miss")
+
+    with stage("gather_discovery"):
+        discovery = gather_discovery(project_root, config, use_cache=not args.no_cache, jobs=args.jobs, inventory=inventory)
     print_discovery(discovery)
 
     endpoints = discovery.get("endpoints", [])
-    detect_auth(endpoints, config)
-    ordered = infer_order(endpoints, config)
-    plan = build_plan(ordered, config)
+    with stage("plan"):
+        detect_auth(endpoints, config)
+        ordered = infer_order(endpoints, config)
+        plan = build_plan(ordered, config, discovery.get("openapi"))
+        if label:
+            total = len(plan)
+            plan = shard_plan(plan, args.shard[0], args.shard[1], load_latencies(timings))
+            print(f"Shard {args.shard[0]}/{args.shard[1]}: {len(plan)} of {total} plan entries")
 
     if args.only_discovery or args.command == "discover":
-        print(json.dumps(redact_dict(discovery), indent=2))
+        printable = {key: value for key, value in discovery.items() if key != "openapi"}
+        print(json.dumps(redact_dict(printable), indent=2))
         return 0
 
-    runtime = detect_runtime()
     report_dir = os.path.join(project_root, "reports")
-    artifacts_dir = os.path.join(project_root, "artifacts")
+    artifacts_dir = os.path.join(project_root, "artifacts", "shards", label) if label else os.path.join(project_root, "artifacts")
     os.makedirs(report_dir, exist_ok=True)
     os.makedirs(artifacts_dir, exist_ok=True)
-    report_path = args.report_path or os.path.join(report_dir, "api-test-report.md")
-    runner_path = os.path.join(project_root, ".api-test-runner", "generated_runner")
-    if runtime == "python":
-        runner_path += ".py"
-    elif runtime == "node":
-        runner_path += ".js"
-    else:
-        runner_path += ".sh"
 
     payload_config = dict(config)
     payload_config["baseUrl"] = discovery.get("base_url")
@@ -133,17 +480,90 @@ def main() -> int:
     if payload_db:
         payload_db = dict(payload_db)
         payload_db["engine"] = discovery.get("db_engine")
+        database = payload_db.get("database")
+        if payload_db["engine"] == "sqlite" and database and database != ":memory:" and not os.path.isabs(database):
+            payload_db["database"] = os.path.join(project_root, database)
     payload_config["db"] = payload_db
     payload_config["dbClis"] = discovery.get("db_clis") if not args.no_db else {}
+    payload_config["stateDir"] = os.path.dirname(runner_path)
 
-    generate_runner(plan, payload_config, runtime, runner_path, report_path, artifacts_dir)
+    with stage("generate_runner"):
+        generate_runner(plan, payload_config, runtime, runner_path, report_path, artifacts_dir)
+    if fingerprint:
+        with stage("save_fingerprint"):
+            save_fingerprint(project_root, fingerprint, runtime, runner_path)
     print("Generated runner:", runner_path)
 
     if args.only_generate or args.command == "generate" or args.dry_run:
         print("Dry-run enabled; no network calls executed.")
         return 0
 
-    if args.command == "run" or args.run:
-        return run_runner(runtime, runner_path)
+    if args.command in {"run", "bench"} or args.run:
+        engine = Engine(plan, payload_config, report_path, artifacts_dir) if args.in_process else None
+        return execute_with_backend(
+            project_root, config, payload_config["baseUrl"], plan, report_path, start_backend,
+            lambda: execute_runner(args.command, runtime, runner_path, engine),
+        )
 
     return 0
+
+
+def execute_with_backend(
+    project_root: str,
+    config: Dict,
+    base_url: str,
+    plan: List[Dict],
+    report_path: str,
+    start_backend: bool,
+    execute: Callable[[], int],
+) -> int:
+    lifecycle_path = lifecycle_path_for(report_path)
+    if not start_backend:
+        if os.path.exists(lifecycle_path):
+            os.remove(lifecycle_path)
+        with stage("execute"):
+            return execute()
+
+    spec = infer_start_command(project_root, config)
+    if spec is None:
+        print("Backend start: no start command found; set start.command in the config or pass --start-command")
+        return 1
+    backend = BackendProcess(project_root, spec, base_url, resolve_health_path(config, plan))
+    print("Starting backend:", spec["command"])
+    executed = False
+    code = 1
+    try:
+        with stage("backend.start"):
+            backend.start()
+            metrics = backend.wait_ready()
+        print(f"Backend ready in {metrics['time_to_ready_ms']} ms (port open after {metrics.get('cold_start_ms')} ms)")
+        write_lifecycle(lifecycle_path, metrics)
+        executed = True
+        with stage("execute"):
+            code = execute()
+    except BackendStartError as exc:
+        print("Backend start failed:", exc)
+    finally:
+        backend.stop()
+        write_lifecycle(lifecycle_path, backend.metrics)
+        print("Backend stopped; log:", backend.log_path)
+    journal = journal_path_for(report_path)
+    if executed and os.path.exists(journal):
+        rebuild_reports(journal, report_path)
+    return code
+
+
+def execute_runner(command: str, runtime: str, runner_path: str, engine: Optional[Engine] = None) -> int:
+    if command == "bench":
+        if runtime != "python":
+            print("Benchmark mode requires the Python runner; detected runtime:", runtime)
+            return 2
+        if engine is not None:
+            engine.bench()
+            return 0
+        return run_runner(runtime, runner_path, ["--bench"])
+    if engine is not None and runtime == "python":
+        results = engine.run()
+        print("Executed", len(results), "requests in-process.")
+        return 0
+    return run_runner(runtime, runner_path)
@@ -7,6 +7,7 @@ DEFAULT_CONFIG = {
     "allowDelete": False,
     "timeoutSeconds": 10,
     "retries": 1,
+    "concurrency": 1,
 }
 
 
@@ -2,12 +2,18 @@ from .backend import detect_backend
 from .db import detect_db_clis, detect_db_engine, parse_db_url
 from .endpoints import discover_endpoints
 from .env import discover_env
+from .extractors import register_extractor
+from .openapi import OpenApiIndex, example_payload, load_openapi_indexes
 
 __all__ = [
+    "OpenApiIndex",
     "detect_backend",
     "detect_db_clis",
     "detect_db_engine",
     "parse_db_url",
     "discover_endpoints",
     "discover_env",
+    "example_payload",
+    "load_openapi_indexes",
+    "register_extractor",
 ]
@@ -3,6 +3,18 @@ import shutil
 from typing import Dict
 
 
+SQLITE_EXTS = (".db", ".sqlite", ".sqlite3")
+
+
+def sqlite_path(url: str) -> str:
+    rest = url.split(":", 1)[1] if ":" in url else url
+    if rest.startswith("///"):
+        rest = rest[3:]
+    elif rest.startswith("//"):
+        rest = rest[2:]
+    return rest.split("?", 1)[0] or ":memory:"
+
+
 def parse_db_url(url: str) -> Dict[str, str]:
     result: Dict[str, str] = {}
     if url.startswith("jdbc:"):
@@ -11,8 +23,10 @@ def parse_db_url(url: str) -> Dict[str, str]:
         result["engine"] = "postgres"
     elif url.startswith("mysql"):
         result["engine"] = "mysql"
-    elif url.startswith("sqlite"):
+    elif url.startswith(("sqlite", "file:")) or ("://" not in url and url.split("?", 1)[0].endswith(SQLITE_EXTS)):
         result["engine"] = "sqlite"
+        result["database"] = sqlite_path(url)
+        return result
 
     match = re.match(r"\w+://([^:/]+)(?::(\d+))?/([^?]+)", url)
     if match:
@@ -34,6 +48,8 @@ def detect_db_engine(db_info: Dict[str, str]) -> str:
         return "mysql"
     if "sqlite" in url:
         return "sqlite"
+    if db_info.get("database", "").endswith(SQLITE_EXTS):
+        return "sqlite"
     return "unknown"
 
 
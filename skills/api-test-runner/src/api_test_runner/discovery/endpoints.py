@@ -1,42 +1,73 @@
 import os
 import re
-from typing import Dict, List
-
-from ..util import find_files, find_files_by_ext, read_json, read_text
-
-OPENAPI_FILES = [
-    "openapi.json",
-    "openapi.yaml",
-    "openapi.yml",
-    "swagger.json",
-    "swagger.yaml",
-    "swagger.yml",
-]
-
-
-def discover_endpoints(project_root: str) -> List[Dict]:
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Iterable, List, Optional
+
+from ..cache import CACHE_VERSION, DiscoveryCache
+from ..inventory import Inventory, build_inventory
+from ..planning import template_key
+from ..profiling import count, stage
+from ..util import iter_lines, mapped_file
+from .extractors import ENGINE
+from .openapi import OPENAPI_FILES, index_for_file
+
+PARALLEL_MIN_FILES = 256
+CHUNKS_PER_JOB = 4
+
+
+def default_jobs() -> int:
+    return os.cpu_count() or 1
+
+
+def discover_endpoints(
+    project_root: str,
+    inventory: Optional[Inventory] = None,
+    cache: Optional[DiscoveryCache] = None,
+    jobs: int = 1,
+) -> List[Dict]:
+    if inventory is None:
+        inventory = build_inventory(project_root)
     endpoints: List[Dict] = []
-    endpoints.extend(from_openapi(project_root))
-    endpoints.extend(from_source(project_root))
+    with stage("openapi"):
+        endpoints.extend(from_openapi(project_root, inventory, cache))
+    with stage("source"):
+        endpoints.extend(from_source(project_root, inventory, cache, jobs))
     deduped = {}
     for ep in endpoints:
-        key = (ep.get("method"), ep.get("path"))
+        key = (ep.get("method"), template_key(ep.get("path") or ""))
         deduped[key] = ep
     return list(deduped.values())
 
 
-def from_openapi(project_root: str) -> List[Dict]:
+def from_openapi(
+    project_root: str,
+    inventory: Optional[Inventory] = None,
+    cache: Optional[DiscoveryCache] = None,
+) -> List[Dict]:
+    if inventory is None:
+        inventory = build_inventory(project_root)
     endpoints: List[Dict] = []
-    for path in find_files(project_root, OPENAPI_FILES):
-        if path.endswith(".json"):
-            data = read_json(path) or {}
-            endpoints.extend(_extract_openapi_paths(data))
-        else:
-            text = read_text(path)
-            endpoints.extend(_extract_openapi_yaml(text))
+    for path in inventory.find(OPENAPI_FILES):
+        entry = inventory.get(path)
+        found = cache.lookup("openapi", entry) if cache else None
+        if found is None:
+            found = extract_openapi_file(path)
+            count("openapi_files_parsed")
+            count("bytes_read", entry.size if entry else 0)
+            if cache:
+                cache.store("openapi", entry, found)
+        endpoints.extend(found)
     return endpoints
 
 
+def extract_openapi_file(path: str) -> List[Dict]:
+    spec = index_for_file(path).spec
+    if spec is not None or path.endswith(".json"):
+        return _extract_openapi_paths(spec or {})
+    return _extract_openapi_yaml_lines(iter_lines(path))
+
+
 def _extract_openapi_paths(data: Dict) -> List[Dict]:
     endpoints: List[Dict] = []
     paths = data.get("paths") or {}
@@ -49,7 +80,6 @@ def _extract_openapi_paths(data: Dict) -> List[Dict]:
 
 
 def _extract_openapi_yaml(text: str) -> List[Dict]:
-    endpoints: List[Dict] = []
     try:
         import yaml  # type: ignore
 
@@ -57,9 +87,13 @@ def _extract_openapi_yaml(text: str) -> List[Dict]:
         return _extract_openapi_paths(data)
     except Exception:
         pass
+    return _extract_openapi_yaml_lines(text.splitlines())
+
 
+def _extract_openapi_yaml_lines(lines: Iterable[str]) -> List[Dict]:
+    endpoints: List[Dict] = []
     current_path = None
-    for line in text.splitlines():
+    for line in lines:
         if re.match(r"^\s*/", line):
             current_path = line.split(":", 1)[0].strip()
         elif current_path and re.match(r"^\s*(get|post|put|patch|delete):", line, re.I):
@@ -68,63 +102,63 @@ def _extract_openapi_yaml(text: str) -> List[Dict]:
     return endpoints
 
 
-def from_source(project_root: str) -> List[Dict]:
-    endpoints: List[Dict] = []
-    files = find_files_by_ext(project_root, {".java", ".kt", ".js", ".ts"})
+def from_source(
+    project_root: str,
+    inventory: Optional[Inventory] = None,
+    cache: Optional[DiscoveryCache] = None,
+    jobs: int = 1,
+) -> List[Dict]:
+    if inventory is None:
+        inventory = build_inventory(project_root)
+    files = inventory.find_by_ext(ENGINE.exts)
+    per_file: List[Optional[List[Dict]]] = []
+    pending: List[int] = []
     for path in files:
-        text = read_text(path)
-        if not text:
-            continue
-        endpoints.extend(_extract_spring(text))
-        endpoints.extend(_extract_nest(text))
-        endpoints.extend(_extract_express(text))
-    return endpoints
-
+        found = cache.lookup("endpoints", inventory.get(path)) if cache else None
+        if found is None:
+            pending.append(len(per_file))
+        per_file.append(found)
+
+    count("source_files", len(files))
+    count("source_files_parsed", len(pending))
+    count("bytes_read", sum(inventory.get(files[idx]).size for idx in pending))
+    with stage("extract"):
+        extracted = _extract_files([files[idx] for idx in pending], jobs)
+    for idx, found in zip(pending, extracted):
+        per_file[idx] = found
+        count("route_matches", len(found))
+        if cache:
+            cache.store("endpoints", inventory.get(files[idx]), found)
 
-def _extract_spring(text: str) -> List[Dict]:
     endpoints: List[Dict] = []
-    mapping_patterns = {
-        "GET": r"@GetMapping\(\"([^\"]*)\"\)",
-        "POST": r"@PostMapping\(\"([^\"]*)\"\)",
-        "PUT": r"@PutMapping\(\"([^\"]*)\"\)",
-        "PATCH": r"@PatchMapping\(\"([^\"]*)\"\)",
-        "DELETE": r"@DeleteMapping\(\"([^\"]*)\"\)",
-    }
-    for method, pattern in mapping_patterns.items():
-        for match in re.findall(pattern, text):
-            endpoints.append({"method": method, "path": _normalize_path(match), "source": "spring"})
-    for match in re.findall(r"@RequestMapping\(\"([^\"]*)\"\)", text):
-        endpoints.append({"method": "GET", "path": _normalize_path(match), "source": "spring"})
+    for found in per_file:
+        endpoints.extend(found or [])
     return endpoints
 
 
-def _extract_nest(text: str) -> List[Dict]:
-    endpoints: List[Dict] = []
-    controller_match = re.findall(r"@Controller\(['\"]([^'\"]*)['\"]\)", text)
-    base = controller_match[0] if controller_match else ""
-    mapping_patterns = {
-        "GET": r"@Get\(['\"]?([^'\"]*)['\"]?\)",
-        "POST": r"@Post\(['\"]?([^'\"]*)['\"]?\)",
-        "PUT": r"@Put\(['\"]?([^'\"]*)['\"]?\)",
-        "PATCH": r"@Patch\(['\"]?([^'\"]*)['\"]?\)",
-        "DELETE": r"@Delete\(['\"]?([^'\"]*)['\"]?\)",
-    }
-    for method, pattern in mapping_patterns.items():
-        for match in re.findall(pattern, text):
-            path = "/".join([p for p in [base, match] if p])
-            endpoints.append({"method": method, "path": _normalize_path(path), "source": "nestjs"})
-    return endpoints
+def _extract_files(paths: List[str], jobs: int) -> List[List[Dict]]:
+    if jobs <= 1 or len(paths) < PARALLEL_MIN_FILES:
+        return _extract_chunk(paths)
+    size = max(1, -(-len(paths) // (jobs * CHUNKS_PER_JOB)))
+    chunks = [paths[i : i + size] for i in range(0, len(paths), size)]
+    results: List[List[Dict]] = []
+    try:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            for chunk_result in pool.map(_extract_chunk, chunks):
+                results.extend(chunk_result)
+    except (OSError, BrokenProcessPool):
+        return _extract_chunk(paths)
+    return results
 
 
-def _extract_express(text: str) -> List[Dict]:
-    endpoints: List[Dict] = []
-    for match in re.findall(r"(?:app|router)\.(get|post|put|patch|delete)\(\s*['\"]([^'\"]+)['\"]", text):
-        method, path = match
-        endpoints.append({"method": method.upper(), "path": _normalize_path(path), "source": "express"})
-    return endpoints
+def _extract_chunk(paths: List[str]) -> List[List[Dict]]:
+    return [extract_source_file(path) for path in paths]
+
+
+def extract_source_file(path: str) -> List[Dict]:
+    with mapped_file(path) as data:
+        return ENGINE.extract(data, os.path.splitext(path)[1])
 
 
-def _normalize_path(path: str) -> str:
-    if not path.startswith("/"):
-        return "/" + path
-    return path
+def cache_version() -> str:
+    return f"{CACHE_VERSION}:{ENGINE.signature()}"
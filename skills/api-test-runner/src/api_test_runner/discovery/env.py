@@ -1,8 +1,11 @@
-import os
+import mmap
 import re
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Optional, Union
 
-from ..util import find_files, parse_env_text, read_text
+from ..cache import DiscoveryCache
+from ..inventory import Inventory, build_inventory
+from ..profiling import count
+from ..util import iter_lines, mapped_file, parse_env_lines, parse_env_text
 from .db import parse_db_url
 
 
@@ -19,22 +22,28 @@ ENV_FILENAMES = [
 ]
 
 
-def discover_env(project_root: str) -> Dict:
-    env_files = find_files(project_root, ENV_FILENAMES)
+def discover_env(
+    project_root: str,
+    inventory: Optional[Inventory] = None,
+    cache: Optional[DiscoveryCache] = None,
+) -> Dict:
+    if inventory is None:
+        inventory = build_inventory(project_root)
+    env_files = inventory.find(ENV_FILENAMES)
     env_vars: Dict[str, str] = {}
     base_url = None
     db = {}
 
     for path in env_files:
-        content = read_text(path)
-        if path.endswith((".env", ".env.local", ".env.development", ".env.production")):
-            env_vars.update(parse_env_text(content))
-        elif path.endswith(".properties"):
-            env_vars.update(parse_properties(content))
-        elif path.endswith((".yml", ".yaml")):
-            env_vars.update(parse_yaml(content))
-        elif path.endswith(("docker-compose.yml", "compose.yaml")):
-            env_vars.update(parse_compose(content))
+        entry = inventory.get(path)
+        parsed = cache.lookup("env", entry) if cache else None
+        if parsed is None:
+            parsed = parse_env_file(path)
+            count("env_files_parsed")
+            count("bytes_read", entry.size if entry else 0)
+            if cache:
+                cache.store("env", entry, parsed)
+        env_vars.update(parsed)
 
     base_url = extract_base_url(env_vars)
     db = extract_db_info(env_vars)
@@ -47,9 +56,26 @@ def discover_env(project_root: str) -> Dict:
     }
 
 
+def parse_env_file(path: str) -> Dict[str, str]:
+    if path.endswith((".env", ".env.local", ".env.development", ".env.production")):
+        return parse_env_lines(iter_lines(path))
+    if path.endswith(".properties"):
+        return parse_properties_lines(iter_lines(path))
+    if path.endswith((".yml", ".yaml")):
+        return parse_yaml_lines(iter_lines(path))
+    if path.endswith(("docker-compose.yml", "compose.yaml")):
+        with mapped_file(path) as data:
+            return parse_compose(data)
+    return {}
+
+
 def parse_properties(text: str) -> Dict[str, str]:
+    return parse_properties_lines(text.splitlines())
+
+
+def parse_properties_lines(lines: Iterable[str]) -> Dict[str, str]:
     result: Dict[str, str] = {}
-    for line in text.splitlines():
+    for line in lines:
         line = line.strip()
         if not line or line.startswith("#") or "=" not in line:
             continue
@@ -59,8 +85,12 @@ def parse_properties(text: str) -> Dict[str, str]:
 
 
 def parse_yaml(text: str) -> Dict[str, str]:
+    return parse_yaml_lines(text.splitlines())
+
+
+def parse_yaml_lines(lines: Iterable[str]) -> Dict[str, str]:
     result: Dict[str, str] = {}
-    for line in text.splitlines():
+    for line in lines:
         if ":" not in line:
             continue
         key, value = line.split(":", 1)
@@ -71,11 +101,15 @@ def parse_yaml(text: str) -> Dict[str, str]:
     return result
 
 
-def parse_compose(text: str) -> Dict[str, str]:
+def parse_compose(text: Union[str, bytes, mmap.mmap]) -> Dict[str, str]:
     result: Dict[str, str] = {}
-    port_match = re.search(r"-\s*(\d+):\d+", text)
+    if isinstance(text, str):
+        port_match = re.search(r"-\s*(\d+):\d+", text)
+    else:
+        port_match = re.search(rb"-\s*(\d+):\d+", text)
     if port_match:
-        result["PORT"] = port_match.group(1)
+        port = port_match.group(1)
+        result["PORT"] = port if isinstance(port, str) else port.decode("ascii")
     return result
 
 
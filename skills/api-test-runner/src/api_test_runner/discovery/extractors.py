@@ -0,0 +1,153 @@
+import hashlib
+import re
+from typing import Callable, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+Handler = Callable[[Sequence[str], Dict], Optional[Dict]]
+
+
+class RouteRule(NamedTuple):
+    framework: str
+    pattern: bytes
+    handler: Handler
+    context: bool
+    exts: FrozenSet[str]
+
+
+class ExtractionEngine:
+    def __init__(self) -> None:
+        self.rules: List[RouteRule] = []
+        self.markers: Set[bytes] = set()
+        self.exts: Set[str] = set()
+        self._compiled: Dict[Optional[str], Tuple[Optional["re.Pattern[bytes]"], Dict[str, range]]] = {}
+
+    def register(
+        self,
+        framework: str,
+        pattern: bytes,
+        handler: Handler,
+        markers: Iterable[bytes],
+        exts: Iterable[str],
+        context: bool = False,
+    ) -> None:
+        exts = frozenset(exts)
+        self.rules.append(RouteRule(framework, pattern, handler, context, exts))
+        self.markers.update(markers)
+        self.exts.update(exts)
+        self._compiled = {}
+
+    def compile(self, ext: Optional[str] = None) -> Tuple[Optional["re.Pattern[bytes]"], Dict[str, range]]:
+        key = ext if ext in self.exts else None
+        if key not in self._compiled:
+            selected = [(idx, rule) for idx, rule in enumerate(self.rules) if key is None or key in rule.exts]
+            if not selected:
+                self._compiled[key] = (None, {})
+                return self._compiled[key]
+            regex = re.compile(b"|".join(b"(?P<r%d>%s)" % (idx, rule.pattern) for idx, rule in selected))
+            slots = {}
+            for idx, rule in selected:
+                start = regex.groupindex[f"r{idx}"] + 1
+                slots[f"r{idx}"] = range(start, start + re.compile(rule.pattern).groups)
+            self._compiled[key] = (regex, slots)
+        return self._compiled[key]
+
+    def signature(self) -> str:
+        digest = hashlib.sha1()
+        for rule in self.rules:
+            digest.update(rule.framework.encode("utf-8") + b"\0" + rule.pattern + b"\0")
+            digest.update(",".join(sorted(rule.exts)).encode("utf-8") + b"\0")
+        return digest.hexdigest()[:12]
+
+    def wants(self, data: bytes) -> bool:
+        return any(data.find(marker) != -1 for marker in self.markers)
+
+    def extract(self, data: bytes, ext: Optional[str] = None) -> List[Dict]:
+        if not data or not self.wants(data):
+            return []
+        regex, slots = self.compile(ext)
+        if regex is None:
+            return []
+        state: Dict = {}
+        routes = []
+        for match in regex.finditer(data):
+            rule = self.rules[int(match.lastgroup[1:])]
+            groups = [(match.group(i) or b"").decode("utf-8", errors="replace") for i in slots[match.lastgroup]]
+            if rule.context:
+                rule.handler(groups, state)
+            else:
+                routes.append((rule, groups))
+        endpoints: List[Dict] = []
+        for rule, groups in routes:
+            endpoint = rule.handler(groups, state)
+            if endpoint:
+                endpoints.append(endpoint)
+        return endpoints
+
+
+def normalize_path(path: str) -> str:
+    if not path.startswith("/"):
+        return "/" + path
+    return path
+
+
+def _spring_route(groups: Sequence[str], state: Dict) -> Dict:
+    verb, path = groups
+    method = "GET" if verb == "Request" else verb.upper()
+    return {"method": method, "path": normalize_path(path), "source": "spring"}
+
+
+def _nest_controller(groups: Sequence[str], state: Dict) -> None:
+    state.setdefault("nest_base", groups[0])
+
+
+def _nest_route(groups: Sequence[str], state: Dict) -> Dict:
+    verb, path = groups
+    joined = "/".join([p for p in [state.get("nest_base", ""), path] if p])
+    return {"method": verb.upper(), "path": normalize_path(joined), "source": "nestjs"}
+
+
+def _express_route(groups: Sequence[str], state: Dict) -> Dict:
+    verb, path = groups
+    return {"method": verb.upper(), "path": normalize_path(path), "source": "express"}
+
+
+ENGINE = ExtractionEngine()
+ENGINE.register(
+    "spring",
+    rb"@(Get|Post|Put|Patch|Delete|Request)Mapping\(\"([^\"]*)\"\)",
+    _spring_route,
+    markers=[b"Mapping("],
+    exts=[".java", ".kt"],
+)
+ENGINE.register(
+    "nestjs",
+    rb"@Controller\(['\"]([^'\"]*)['\"]\)",
+    _nest_controller,
+    markers=[],
+    exts=[".ts", ".js"],
+    context=True,
+)
+ENGINE.register(
+    "nestjs",
+    rb"@(Get|Post|Put|Patch|Delete)\(['\"]?([^'\")]*)['\"]?\)",
+    _nest_route,
+    markers=[b"@Get(", b"@Post(", b"@Put(", b"@Patch(", b"@Delete("],
+    exts=[".ts", ".js"],
+)
+ENGINE.register(
+    "express",
+    rb"(?:app|router)\.(get|post|put|patch|delete)\(\s*['\"]([^'\"]+)['\"]",
+    _express_route,
+    markers=[b"app.", b"router."],
+    exts=[".js", ".ts"],
+)
+
+
+def register_extractor(
+    framework: str,
+    pattern: bytes,
+    handler: Handler,
+    markers: Iterable[bytes],
+    exts: Iterable[str],
+    context: bool = False,
+) -> None:
+    ENGINE.register(framework, pattern, handler, markers, exts, context)
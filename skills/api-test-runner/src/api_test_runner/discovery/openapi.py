@@ -0,0 +1,272 @@
+import os
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..cache import DiscoveryCache
+from ..inventory import Inventory, build_inventory
+from ..util import read_json
+
+OPENAPI_FILES = [
+    "openapi.json",
+    "openapi.yaml",
+    "openapi.yml",
+    "swagger.json",
+    "swagger.yaml",
+    "swagger.yml",
+]
+
+BODY_METHODS = {"POST", "PUT", "PATCH"}
+MAX_DEPTH = 8
+SKIP = object()
+STRING_FORMATS = {
+    "email": "user@example.com",
+    "uuid": "00000000-0000-4000-8000-000000000000",
+    "date": "2024-01-01",
+    "date-time": "2024-01-01T00:00:00Z",
+    "time": "00:00:00",
+    "uri": "https://example.com",
+    "url": "https://example.com",
+    "hostname": "example.com",
+    "ipv4": "127.0.0.1",
+    "ipv6": "::1",
+    "password": "Password123!",
+    "byte": "c3RyaW5n",
+}
+
+
+PATH_PARAM = re.compile(r":(\w+)")
+
+
+def operation_key(method: str, path: str) -> str:
+    return method.upper() + " " + PATH_PARAM.sub(r"{\1}", path)
+
+
+def load_spec(path: str) -> Optional[Dict]:
+    if path.endswith(".json"):
+        data = read_json(path)
+    else:
+        try:
+            import yaml  # type: ignore
+
+            with open(path, "r", encoding="utf-8", errors="replace") as handle:
+                data = yaml.safe_load(handle)
+        except Exception:
+            return None
+    return data if isinstance(data, dict) else None
+
+
+class OpenApiIndex:
+    def __init__(self, spec: Optional[Dict] = None, bodies: Optional[Dict[str, Any]] = None, refs: Optional[Dict] = None):
+        self.spec = spec
+        self.bodies: Dict[str, Any] = bodies if bodies is not None else index_bodies(spec or {})
+        self.refs: Dict[str, Any] = dict(refs or {})
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "OpenApiIndex":
+        return cls(None, data.get("bodies") or {}, data.get("refs") or {})
+
+    def to_dict(self) -> Dict:
+        return {"bodies": self.bodies, "refs": {ref: self.lookup(ref) for ref in self.reachable_refs()}}
+
+    def lookup(self, ref: str) -> Any:
+        if ref not in self.refs:
+            self.refs[ref] = self.pointer(ref)
+        return self.refs[ref]
+
+    def pointer(self, ref: str) -> Any:
+        if self.spec is None or not ref.startswith("#/"):
+            return {}
+        node: Any = self.spec
+        for part in ref[2:].split("/"):
+            part = part.replace("~1", "/").replace("~0", "~")
+            if isinstance(node, dict) and part in node:
+                node = node[part]
+            elif isinstance(node, list) and part.isdigit() and int(part) < len(node):
+                node = node[int(part)]
+            else:
+                return {}
+        return node
+
+    def resolve(self, node: Any) -> Any:
+        seen = set()
+        while isinstance(node, dict) and isinstance(node.get("$ref"), str):
+            ref = node["$ref"]
+            if ref in seen:
+                return {}
+            seen.add(ref)
+            node = self.lookup(ref)
+        return node
+
+    def reachable_refs(self) -> List[str]:
+        found: List[str] = []
+        seen = set()
+        stack: List[Any] = list(self.bodies.values())
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                ref = node.get("$ref")
+                if isinstance(ref, str) and ref not in seen:
+                    seen.add(ref)
+                    found.append(ref)
+                    stack.append(self.lookup(ref))
+                stack.extend(value for key, value in node.items() if key != "$ref")
+            elif isinstance(node, list):
+                stack.extend(node)
+        return found
+
+    def request_schema(self, method: str, path: str) -> Optional[Any]:
+        body = self.resolve(self.bodies.get(operation_key(method, path)))
+        if not isinstance(body, dict):
+            return None
+        content = body.get("content")
+        if isinstance(content, dict):
+            media = content.get("application/json")
+            if media is None:
+                media = next((value for key, value in content.items() if "json" in key), None)
+            return media.get("schema") if isinstance(media, dict) else None
+        return body.get("schema")
+
+
+def index_bodies(spec: Dict) -> Dict[str, Any]:
+    bodies: Dict[str, Any] = {}
+    for path, item in (spec.get("paths") or {}).items():
+        if not isinstance(item, dict):
+            continue
+        for method, operation in item.items():
+            if method.upper() not in BODY_METHODS or not isinstance(operation, dict):
+                continue
+            body = operation.get("requestBody")
+            if body is None:
+                params = list(item.get("parameters") or []) + list(operation.get("parameters") or [])
+                body = next((p for p in params if isinstance(p, dict) and p.get("in") == "body"), None)
+            if body is not None:
+                bodies[operation_key(method, path)] = body
+    return bodies
+
+
+_FILE_INDEXES: Dict[Tuple[str, float, int], OpenApiIndex] = {}
+
+
+def index_for_file(path: str) -> OpenApiIndex:
+    try:
+        stat = os.stat(path)
+        key = (path, stat.st_mtime, stat.st_size)
+    except OSError:
+        return OpenApiIndex()
+    if key not in _FILE_INDEXES:
+        for stale in [item for item in _FILE_INDEXES if item[0] == path]:
+            del _FILE_INDEXES[stale]
+        _FILE_INDEXES[key] = OpenApiIndex(load_spec(path))
+    return _FILE_INDEXES[key]
+
+
+def load_openapi_indexes(
+    project_root: str,
+    inventory: Optional[Inventory] = None,
+    cache: Optional[DiscoveryCache] = None,
+) -> List[OpenApiIndex]:
+    if inventory is None:
+        inventory = build_inventory(project_root)
+    indexes: List[OpenApiIndex] = []
+    for path in inventory.find(OPENAPI_FILES):
+        entry = inventory.get(path)
+        data = cache.lookup("openapi_index", entry) if cache else None
+        if data is not None:
+            indexes.append(OpenApiIndex.from_dict(data))
+            continue
+        index = index_for_file(path)
+        if cache:
+            cache.store("openapi_index", entry, index.to_dict())
+        indexes.append(index)
+    return indexes
+
+
+def string_example(schema: Dict) -> str:
+    value = STRING_FORMATS.get(schema.get("format", ""), "string")
+    min_length = int(schema.get("minLength") or 0)
+    if len(value) < min_length:
+        value += "x" * (min_length - len(value))
+    if schema.get("maxLength") is not None:
+        value = value[: int(schema["maxLength"])]
+    return value
+
+
+def number_example(schema: Dict, kind: type) -> Any:
+    value = schema.get("minimum")
+    exclusive = schema.get("exclusiveMinimum")
+    if isinstance(exclusive, (int, float)) and not isinstance(exclusive, bool):
+        value = exclusive + 1
+    elif value is not None and exclusive:
+        value += 1
+    if value is None:
+        value = 1
+    maximum = schema.get("maximum")
+    if maximum is not None and value > maximum:
+        value = maximum
+    return kind(value)
+
+
+def synthesize(index: OpenApiIndex, schema: Any, stack: Tuple[str, ...] = ()) -> Any:
+    if isinstance(schema, dict) and isinstance(schema.get("$ref"), str):
+        ref = schema["$ref"]
+        if ref in stack or len(stack) >= MAX_DEPTH:
+            return SKIP
+        return synthesize(index, index.lookup(ref), stack + (ref,))
+    if not isinstance(schema, dict):
+        return None
+    for key in ("example", "default", "const"):
+        if key in schema:
+            return schema[key]
+    if isinstance(schema.get("examples"), list) and schema["examples"]:
+        return schema["examples"][0]
+    if schema.get("enum"):
+        return schema["enum"][0]
+    if schema.get("allOf"):
+        merged: Dict = {}
+        for part in schema["allOf"]:
+            value = synthesize(index, part, stack)
+            if isinstance(value, dict):
+                merged.update(value)
+        return merged
+    for key in ("oneOf", "anyOf"):
+        if schema.get(key):
+            return synthesize(index, schema[key][0], stack)
+
+    kind = schema.get("type")
+    if isinstance(kind, list):
+        kind = next((item for item in kind if item != "null"), None)
+    if kind == "object" or "properties" in schema:
+        props = schema.get("properties") or {}
+        names = schema.get("required")
+        result = {}
+        for name in props if names is None else names:
+            prop = props.get(name, {})
+            resolved = index.resolve(prop)
+            if isinstance(resolved, dict) and resolved.get("readOnly"):
+                continue
+            value = synthesize(index, prop, stack)
+            if value is not SKIP:
+                result[name] = value
+        return result
+    if kind == "array":
+        item = synthesize(index, schema.get("items") or {}, stack)
+        return [] if item is SKIP else [item]
+    if kind == "string":
+        return string_example(schema)
+    if kind == "integer":
+        return number_example(schema, int)
+    if kind == "number":
+        return number_example(schema, float)
+    if kind == "boolean":
+        return True
+    return None
+
+
+def example_payload(indexes: Iterable[OpenApiIndex], method: str, path: str) -> Optional[Any]:
+    for index in indexes:
+        schema = index.request_schema(method, path)
+        if schema is None:
+            continue
+        value = synthesize(index, schema)
+        return None if value is SKIP else value
+    return None
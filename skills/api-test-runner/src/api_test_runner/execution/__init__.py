@@ -1,3 +1,5 @@
+from .engine import Engine
+from .lifecycle import BackendProcess, BackendStartError, infer_start_command, resolve_health_path
 from .run import run_runner
 
-__all__ = ["run_runner"]
+__all__ = ["BackendProcess", "BackendStartError", "Engine", "infer_start_command", "resolve_health_path", "run_runner"]
@@ -0,0 +1,60 @@
+import os
+from types import CodeType
+from typing import Dict, List, Optional
+
+from ..generation.runner import load_plan, plan_path_for, render_runner, template_path_for
+from ..reporting import iter_journal, journal_path_for
+
+_CODE: Optional[CodeType] = None
+
+
+def runner_code() -> CodeType:
+    global _CODE
+    if _CODE is None:
+        _CODE = compile(render_runner("python", "in-process.plan.jsonl"), template_path_for("python"), "exec")
+    return _CODE
+
+
+class Engine:
+    def __init__(self, plan: List[Dict], config: Dict, report_path: str, artifacts_dir: str):
+        self.plan = plan
+        self.config = config
+        self.report_path = report_path
+        self.artifacts_dir = artifacts_dir
+
+    @classmethod
+    def from_plan_file(cls, path: str) -> "Engine":
+        header, plan = load_plan(path)
+        return cls(plan, header.get("config", {}), header.get("report_path"), header.get("artifacts_dir"))
+
+    @classmethod
+    def from_runner(cls, runner_path: str) -> "Engine":
+        return cls.from_plan_file(plan_path_for(runner_path))
+
+    def state_dir(self) -> str:
+        anchor = self.report_path or self.artifacts_dir or os.path.join(os.getcwd(), "report")
+        return os.path.join(os.path.dirname(os.path.abspath(anchor)), ".api-test-runner")
+
+    def load(self) -> Dict:
+        config = dict(self.config)
+        config.setdefault("stateDir", self.state_dir())
+        namespace = {
+            "__name__": "api_test_runner_engine",
+            "__file__": template_path_for("python"),
+            "ENGINE_PAYLOAD": {
+                "plan": self.plan,
+                "config": config,
+                "report_path": self.report_path,
+                "artifacts_dir": self.artifacts_dir,
+            },
+        }
+        exec(runner_code(), namespace)
+        return namespace
+
+    def run(self) -> List[Dict]:
+        self.load()["main"]()
+        results = list(iter_journal(journal_path_for(self.report_path)))
+        return sorted(results, key=lambda item: item.get("index", 0))
+
+    def bench(self) -> Dict:
+        return self.load()["run_bench"]()
@@ -0,0 +1,223 @@
+import json
+import os
+import re
+import shlex
+import signal
+import socket
+import subprocess
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from typing import Dict, List, Optional
+
+from ..planning import is_health_path
+from ..util import read_json, read_text
+
+PACKAGE_SCRIPTS = ["start:dev", "dev", "start", "serve"]
+MAKE_TARGETS = ["run", "start", "serve", "dev"]
+COMPOSE_FILES = ["docker-compose.yml", "docker-compose.yaml", "compose.yml", "compose.yaml"]
+LOG_FILE = "backend.log"
+DEFAULT_READY_TIMEOUT = 60.0
+STOP_GRACE_SECONDS = 10.0
+
+
+class BackendStartError(RuntimeError):
+    pass
+
+
+def infer_start_command(project_root: str, config: Dict) -> Optional[Dict]:
+    start = dict(config.get("start") or {})
+    if start.get("command"):
+        return start
+
+    pkg = read_json(os.path.join(project_root, "package.json")) or {}
+    scripts = pkg.get("scripts") or {}
+    for name in PACKAGE_SCRIPTS:
+        if name in scripts:
+            start["command"] = "npm start" if name == "start" else f"npm run {name}"
+            start["source"] = "package.json"
+            return start
+
+    makefile = os.path.join(project_root, "Makefile")
+    if os.path.exists(makefile):
+        targets = set(re.findall(r"^([A-Za-z0-9_.-]+)\s*:(?!=)", read_text(makefile), re.M))
+        for name in MAKE_TARGETS:
+            if name in targets:
+                start["command"] = f"make {name}"
+                start["source"] = "Makefile"
+                return start
+
+    if os.path.exists(os.path.join(project_root, "mvnw")) or os.path.exists(os.path.join(project_root, "pom.xml")):
+        wrapper = "./mvnw" if os.path.exists(os.path.join(project_root, "mvnw")) else "mvn"
+        start["command"] = f"{wrapper} spring-boot:run"
+        start["source"] = "pom.xml"
+        return start
+    if os.path.exists(os.path.join(project_root, "gradlew")):
+        start["command"] = "./gradlew bootRun"
+        start["source"] = "gradlew"
+        return start
+
+    for name in COMPOSE_FILES:
+        if os.path.exists(os.path.join(project_root, name)):
+            start["command"] = f"docker compose -f {shlex.quote(name)} up"
+            start.setdefault("stopCommand", f"docker compose -f {shlex.quote(name)} down")
+            start["source"] = name
+            return start
+    return None
+
+
+def resolve_health_path(config: Dict, plan: List[Dict]) -> Optional[str]:
+    start = config.get("start") or {}
+    if start.get("healthPath"):
+        return start["healthPath"]
+    for entry in plan:
+        path = entry.get("path", "")
+        if entry.get("method", "GET") == "GET" and is_health_path(path) and "{" not in path and ":" not in path:
+            return path
+    return None
+
+
+def port_open(host: str, port: int, timeout: float = 1.0) -> bool:
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def health_ok(url: str, timeout: float = 2.0) -> bool:
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as resp:
+            return resp.status < 400
+    except urllib.error.HTTPError as exc:
+        return exc.code < 500 and exc.code not in {404, 408, 429}
+    except (OSError, ValueError):
+        return False
+
+
+class BackendProcess:
+    def __init__(self, project_root: str, spec: Dict, base_url: str, health_path: Optional[str] = None):
+        self.project_root = project_root
+        self.spec = spec
+        self.base_url = base_url
+        self.health_path = health_path
+        self.log_path = os.path.join(project_root, ".api-test-runner", LOG_FILE)
+        self.process: Optional[subprocess.Popen] = None
+        self.log_handle = None
+        self.started_at = 0.0
+        self.metrics: Dict = {}
+
+    def start(self) -> None:
+        if self.process is not None:
+            return
+        os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+        self.log_handle = open(self.log_path, "wb")
+        env = dict(os.environ)
+        env.update({key: str(value) for key, value in (self.spec.get("env") or {}).items()})
+        cwd = os.path.join(self.project_root, self.spec.get("cwd") or "")
+        self.started_at = time.perf_counter()
+        self.process = subprocess.Popen(
+            self.spec["command"],
+            shell=True,
+            cwd=cwd,
+            env=env,
+            stdout=self.log_handle,
+            stderr=subprocess.STDOUT,
+            stdin=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        self.metrics = {
+            "command": self.spec["command"],
+            "source": self.spec.get("source", "config"),
+            "pid": self.process.pid,
+            "spawn_ms": round((time.perf_counter() - self.started_at) * 1000, 3),
+            "log": self.log_path,
+        }
+
+    def wait_ready(self, timeout: Optional[float] = None) -> Dict:
+        if self.process is None:
+            raise BackendStartError("backend process not started")
+        timeout = float(timeout or self.spec.get("readyTimeoutSeconds") or DEFAULT_READY_TIMEOUT)
+        parts = urllib.parse.urlsplit(self.base_url)
+        host = parts.hostname or "localhost"
+        port = int(self.spec.get("port") or parts.port or (443 if parts.scheme == "https" else 80))
+        health_url = self.base_url.rstrip("/") + self.health_path if self.health_path else None
+        deadline = self.started_at + timeout
+        delay = 0.05
+        probes = 0
+        port_ready = None
+        while True:
+            probes += 1
+            if self.process.poll() is not None:
+                self.metrics["exit_code"] = self.process.returncode
+                raise BackendStartError(
+                    f"backend exited with code {self.process.returncode} before becoming ready:\n{self.log_tail()}"
+                )
+            if port_ready is None and port_open(host, port):
+                port_ready = time.perf_counter()
+                self.metrics["cold_start_ms"] = round((port_ready - self.started_at) * 1000, 3)
+            if port_ready is not None and (health_url is None or health_ok(health_url)):
+                ready = time.perf_counter()
+                self.metrics["time_to_ready_ms"] = round((ready - self.started_at) * 1000, 3)
+                self.metrics["probes"] = probes
+                self.metrics["health_url"] = health_url
+                return self.metrics
+            now = time.perf_counter()
+            if now >= deadline:
+                self.metrics["probes"] = probes
+                raise BackendStartError(f"backend not ready after {timeout:.0f}s:\n{self.log_tail()}")
+            time.sleep(min(delay, deadline - now))
+            delay = min(delay * 2, 2.0)
+
+    def stop(self) -> None:
+        if self.process is None:
+            return
+        began = time.perf_counter()
+        if self.process.poll() is None:
+            self.signal(signal.SIGTERM)
+            try:
+                self.process.wait(timeout=STOP_GRACE_SECONDS)
+            except subprocess.TimeoutExpired:
+                self.signal(signal.SIGKILL)
+                self.process.wait()
+        stop_command = self.spec.get("stopCommand")
+        if stop_command:
+            subprocess.run(
+                stop_command,
+                shell=True,
+                cwd=os.path.join(self.project_root, self.spec.get("cwd") or ""),
+                stdout=self.log_handle,
+                stderr=subprocess.STDOUT,
+                check=False,
+            )
+        self.metrics["stop_ms"] = round((time.perf_counter() - began) * 1000, 3)
+        self.metrics["exit_code"] = self.process.returncode
+        if self.log_handle is not None:
+            self.log_handle.close()
+            self.log_handle = None
+        self.process = None
+
+    def signal(self, signum: int) -> None:
+        try:
+            os.killpg(self.process.pid, signum)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    def log_tail(self, lines: int = 20) -> str:
+        if self.log_handle is not None:
+            self.log_handle.flush()
+        return "\n".join(read_text(self.log_path).splitlines()[-lines:])
+
+    def __enter__(self) -> "BackendProcess":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def write_lifecycle(path: str, metrics: Dict) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(metrics, handle, indent=2)
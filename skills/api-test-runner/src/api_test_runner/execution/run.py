@@ -1,5 +1,5 @@
 import subprocess
-from typing import List
+from typing import List, Optional
 
 
 RUNTIME_COMMANDS = {
@@ -9,8 +9,8 @@ RUNTIME_COMMANDS = {
 }
 
 
-def run_runner(runtime: str, script_path: str) -> int:
+def run_runner(runtime: str, script_path: str, extra_args: Optional[List[str]] = None) -> int:
     cmd: List[str] = RUNTIME_COMMANDS.get(runtime, ["python3"])
-    cmd = cmd + [script_path]
+    cmd = cmd + [script_path] + list(extra_args or [])
     result = subprocess.run(cmd, check=False)
     return result.returncode
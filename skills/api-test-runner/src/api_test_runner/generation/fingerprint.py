@@ -0,0 +1,93 @@
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional
+
+from ..discovery.endpoints import OPENAPI_FILES, cache_version
+from ..discovery.env import ENV_FILENAMES
+from ..discovery.extractors import ENGINE
+from ..inventory import FileEntry, Inventory
+from .runner import plan_path_for, template_path_for
+
+FINGERPRINT_FILE = "plan-fingerprint.json"
+PLAN_FORMAT_VERSION = 1
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_package_digest: Optional[str] = None
+BACKEND_MARKERS = ["pom.xml", "build.gradle", "build.gradle.kts", "package.json", "requirements.txt"]
+
+
+def discovery_inputs(inventory: Inventory) -> List[FileEntry]:
+    names = set(ENV_FILENAMES) | set(OPENAPI_FILES) | set(BACKEND_MARKERS)
+    return [entry for entry in inventory.entries if entry.name in names or entry.ext in ENGINE.exts]
+
+
+def package_digest() -> str:
+    global _package_digest
+    if _package_digest is None:
+        digest = hashlib.sha256()
+        for base, dirs, files in os.walk(PACKAGE_DIR):
+            dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+            for name in sorted(files):
+                if name.endswith((".py", ".js")):
+                    path = os.path.join(base, name)
+                    digest.update(os.path.relpath(path, PACKAGE_DIR).encode("utf-8") + b"\0")
+                    with open(path, "rb") as handle:
+                        digest.update(handle.read())
+        _package_digest = digest.hexdigest()
+    return _package_digest
+
+
+def compute_fingerprint(inventory: Inventory, config: Dict, runtime: str, options: Dict) -> str:
+    digest = hashlib.sha256()
+    digest.update(f"{PLAN_FORMAT_VERSION}:{package_digest()}:{cache_version()}".encode("utf-8"))
+    for entry in discovery_inputs(inventory):
+        digest.update(f"{entry.path}\0{entry.size}\0{entry.mtime}\n".encode("utf-8"))
+    digest.update(json.dumps(config, sort_keys=True, default=str).encode("utf-8"))
+    digest.update(json.dumps(options, sort_keys=True, default=str).encode("utf-8"))
+    digest.update(runtime.encode("utf-8"))
+    with open(template_path_for(runtime), "rb") as handle:
+        digest.update(handle.read())
+    return digest.hexdigest()
+
+
+def fingerprint_path(project_root: str) -> str:
+    return os.path.join(project_root, ".api-test-runner", FINGERPRINT_FILE)
+
+
+def load_fingerprint(project_root: str) -> Optional[Dict]:
+    try:
+        with open(fingerprint_path(project_root), "r", encoding="utf-8") as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return None
+
+
+def plan_stamp(runner_path: str) -> Optional[List]:
+    try:
+        stat = os.stat(plan_path_for(runner_path))
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime]
+
+
+def save_fingerprint(project_root: str, fingerprint: str, runtime: str, runner_path: str) -> None:
+    path = fingerprint_path(project_root)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    record = {
+        "fingerprint": fingerprint,
+        "runtime": runtime,
+        "runner_path": runner_path,
+        "plan": plan_stamp(runner_path),
+    }
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(record, handle, indent=2)
+
+
+def fingerprint_matches(project_root: str, fingerprint: str, runner_path: str) -> bool:
+    stored = load_fingerprint(project_root)
+    if not stored or stored.get("fingerprint") != fingerprint:
+        return False
+    if stored.get("runner_path") != runner_path:
+        return False
+    stamp = plan_stamp(runner_path)
+    return os.path.exists(runner_path) and stamp is not None and stamp == stored.get("plan")
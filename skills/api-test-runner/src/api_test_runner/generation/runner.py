@@ -8,6 +8,7 @@ TEMPLATE_MAP = {
     "node": "runner_js.tmpl",
     "bash": "runner_sh.tmpl",
 }
+PLAN_SUFFIX = ".plan.jsonl"
 
 
 def detect_runtime() -> str:
@@ -18,22 +19,56 @@ def detect_runtime() -> str:
     return "bash"
 
 
-def generate_runner(plan: List[Dict], config: Dict, runtime: str, output_path: str, report_path: str, artifacts_dir: str) -> str:
+def template_path_for(runtime: str) -> str:
     template_name = TEMPLATE_MAP.get(runtime, TEMPLATE_MAP["python"])
     template_path = os.path.join(os.path.dirname(__file__), "..", "..", "..", "templates", template_name)
-    template_path = os.path.abspath(template_path)
-    with open(template_path, "r", encoding="utf-8") as handle:
+    return os.path.abspath(template_path)
+
+
+def runner_path_for(project_root: str, runtime: str, suffix: str = "") -> str:
+    ext = {"python": ".py", "node": ".js"}.get(runtime, ".sh")
+    return os.path.join(project_root, ".api-test-runner", "generated_runner" + suffix + ext)
+
+
+def plan_path_for(runner_path: str) -> str:
+    return os.path.splitext(runner_path)[0] + PLAN_SUFFIX
+
+
+def write_plan(path: str, plan: List[Dict], header: Dict) -> str:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as handle:
+        handle.write(json.dumps(header, separators=(",", ":")) + "\n")
+        for entry in plan:
+            handle.write(json.dumps(entry, separators=(",", ":")) + "\n")
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_plan(path: str) -> Tuple[Dict, List[Dict]]:
+    with open(path, "r", encoding="utf-8") as handle:
+        header = json.loads(handle.readline() or "{}")
+        plan = [json.loads(line) for line in handle if line.strip()]
+    return header, plan
+
+
+def render_runner(runtime: str, plan_file: str) -> str:
+    with open(template_path_for(runtime), "r", encoding="utf-8") as handle:
         template = handle.read()
+    return template.replace("{{PLAN_FILE}}", plan_file if runtime == "bash" else json.dumps(plan_file))
+
 
-    payload = {
-        "plan": plan,
+def generate_runner(plan: List[Dict], config: Dict, runtime: str, output_path: str, report_path: str, artifacts_dir: str) -> str:
+    plan_path = plan_path_for(output_path)
+    header = {
         "config": config,
         "report_path": report_path,
         "artifacts_dir": artifacts_dir,
+        "entries": len(plan),
     }
-    rendered = template.replace("{{PAYLOAD_JSON}}", json.dumps(payload, indent=2))
+    write_plan(plan_path, plan, header)
+    rendered = render_runner(runtime, os.path.basename(plan_path))
 
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
     with open(output_path, "w", encoding="utf-8") as handle:
         handle.write(rendered)
     return output_path
@@ -0,0 +1,79 @@
+import os
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from .profiling import count
+
+DEFAULT_PRUNE_DIRS = ["node_modules", "target", "build", "dist", ".git", ".api-test-runner"]
+
+
+class FileEntry(NamedTuple):
+    path: str
+    name: str
+    ext: str
+    size: int
+    mtime: float
+
+
+class Inventory:
+    def __init__(self, root: str, entries: List[FileEntry]):
+        self.root = root
+        self.entries = entries
+        self.by_name: Dict[str, List[FileEntry]] = {}
+        self.by_ext: Dict[str, List[FileEntry]] = {}
+        self.by_path: Dict[str, FileEntry] = {}
+        self.position: Dict[str, int] = {}
+        for pos, entry in enumerate(entries):
+            self.by_name.setdefault(entry.name, []).append(entry)
+            self.by_ext.setdefault(entry.ext, []).append(entry)
+            self.by_path[entry.path] = entry
+            self.position[entry.path] = pos
+
+    def collect(self, index: Dict[str, List[FileEntry]], keys: Iterable[str]) -> List[str]:
+        found = [entry.path for key in set(keys) for entry in index.get(key, [])]
+        return sorted(found, key=self.position.__getitem__)
+
+    def find(self, names: Iterable[str]) -> List[str]:
+        return self.collect(self.by_name, names)
+
+    def find_by_ext(self, exts: Iterable[str]) -> List[str]:
+        return self.collect(self.by_ext, exts)
+
+    def get(self, path: str) -> Optional[FileEntry]:
+        return self.by_path.get(path)
+
+
+def build_inventory(root: str, prune: Optional[Iterable[str]] = None) -> Inventory:
+    prune_set = set(DEFAULT_PRUNE_DIRS if prune is None else prune)
+    entries: List[FileEntry] = []
+    stack = [root]
+    while stack:
+        base = stack.pop()
+        try:
+            with os.scandir(base) as it:
+                items = sorted(it, key=lambda item: item.name)
+        except OSError:
+            continue
+        subdirs = []
+        for item in items:
+            try:
+                if item.is_dir(follow_symlinks=False):
+                    if item.name not in prune_set:
+                        subdirs.append(item.path)
+                    continue
+                if not item.is_file():
+                    continue
+                stat = item.stat()
+            except OSError:
+                continue
+            _, ext = os.path.splitext(item.name)
+            entries.append(FileEntry(item.path, item.name, ext, stat.st_size, stat.st_mtime))
+        stack.extend(reversed(subdirs))
+    count("files_scanned", len(entries))
+    return Inventory(root, entries)
+
+
+def resolve_prune_dirs(config: Dict) -> List[str]:
+    prune = config.get("pruneDirs")
+    if prune is None:
+        return list(DEFAULT_PRUNE_DIRS)
+    return list(prune)
@@ -1,3 +1,16 @@
-from .ordering import infer_order
+from .ordering import infer_order, is_auth_path, is_health_path, resource_base
+from .shard import load_latencies, parse_shard, shard_label, shard_plan
+from .templates import compile_path, template_key
 
-__all__ = ["infer_order"]
+__all__ = [
+    "compile_path",
+    "infer_order",
+    "is_auth_path",
+    "is_health_path",
+    "load_latencies",
+    "parse_shard",
+    "resource_base",
+    "shard_label",
+    "shard_plan",
+    "template_key",
+]
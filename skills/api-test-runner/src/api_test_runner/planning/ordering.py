@@ -4,6 +4,18 @@ from typing import Dict, List
 METHOD_ORDER = {"POST": 1, "GET": 2, "PUT": 3, "PATCH": 4, "DELETE": 5}
 
 
+def is_health_path(path: str) -> bool:
+    return bool(re.search(r"health|status|ping", path, re.I))
+
+
+def is_auth_path(path: str) -> bool:
+    return bool(re.search(r"login|auth|token", path, re.I))
+
+
+def resource_base(path: str) -> str:
+    return path.strip("/").split("/")[0] if path.strip("/") else ""
+
+
 def infer_order(endpoints: List[Dict], config: Dict) -> List[Dict]:
     include = config.get("include") or []
     exclude = config.get("exclude") or []
@@ -23,14 +35,11 @@ def infer_order(endpoints: List[Dict], config: Dict) -> List[Dict]:
     def score(ep: Dict) -> tuple:
         path = ep.get("path", "")
         method = ep.get("method", "GET")
-        is_health = bool(re.search(r"health|status|ping", path, re.I))
-        is_auth = bool(re.search(r"login|auth|token", path, re.I))
-        base = path.strip("/").split("/")[0] if path.strip("/") else ""
         crud_order = METHOD_ORDER.get(method, 99)
         return (
-            0 if is_health else 1,
-            0 if is_auth else 1,
-            base,
+            0 if is_health_path(path) else 1,
+            0 if is_auth_path(path) else 1,
+            resource_base(path),
             crud_order,
             path,
         )
@@ -0,0 +1,88 @@
+import json
+import re
+import statistics
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .templates import PARAM
+
+SHARD_SPEC = re.compile(r"^\s*(\d+)\s*/\s*(\d+)\s*$")
+
+Key = Tuple[str, str]
+
+
+def parse_shard(text: str) -> Tuple[int, int]:
+    match = SHARD_SPEC.match(text or "")
+    if not match:
+        raise ValueError(f"invalid shard {text!r}; expected i/N, e.g. 2/4")
+    index, total = int(match.group(1)), int(match.group(2))
+    if total < 1 or not 1 <= index <= total:
+        raise ValueError(f"invalid shard {text!r}; index must be between 1 and {max(total, 1)}")
+    return index, total
+
+
+def shard_label(index: int, total: int) -> str:
+    return f"{index}-of-{total}"
+
+
+def load_latencies(paths: Iterable[str]) -> Dict[Key, float]:
+    latencies: Dict[Key, float] = {}
+    for path in paths:
+        try:
+            with open(path, "r", encoding="utf-8") as handle:
+                report = json.load(handle)
+        except (OSError, ValueError):
+            continue
+        for item in report.get("results") or []:
+            if item.get("skipped") or not item.get("status"):
+                continue
+            key = (item.get("method", "GET"), item.get("template") or item.get("path", ""))
+            latencies[key] = float(item.get("latency_ms") or 0)
+    return latencies
+
+
+def segments(path: str) -> List[str]:
+    return [segment for segment in path.strip("/").split("/") if segment]
+
+
+def common_prefix(paths: Iterable[str]) -> int:
+    prefix: Optional[List[str]] = None
+    for path in paths:
+        parts = segments(path)
+        literal = next((pos for pos, part in enumerate(parts) if PARAM.search(part)), len(parts))
+        parts = parts[: max(literal - 1, 0)]
+        if prefix is None:
+            prefix = parts
+        size = 0
+        while size < min(len(prefix), len(parts)) and prefix[size] == parts[size]:
+            size += 1
+        prefix = prefix[:size]
+    return len(prefix or [])
+
+
+def shard_key(path: str, prefix: int) -> str:
+    rest = segments(path)[prefix:]
+    return rest[0] if rest else ""
+
+
+def assign_shards(plan: List[Dict], total: int, latencies: Optional[Dict[Key, float]] = None) -> List[int]:
+    latencies = latencies or {}
+    fallback = statistics.median(latencies.values()) if latencies else 1.0
+    prefix = common_prefix(ep.get("path", "") for ep in plan if not ep.get("setup"))
+    keys = [None if ep.get("setup") else shard_key(ep.get("path", ""), prefix) for ep in plan]
+    costs: Dict[str, float] = {}
+    for ep, key in zip(plan, keys):
+        if key is not None:
+            cost = latencies.get((ep.get("method", "GET"), ep.get("path", "")), fallback)
+            costs[key] = costs.get(key, 0.0) + max(cost, 0.001)
+    loads = [0.0] * total
+    owners: Dict[str, int] = {}
+    for key in sorted(costs, key=lambda name: (-costs[name], name)):
+        target = min(range(total), key=lambda shard: (loads[shard], shard))
+        owners[key] = target + 1
+        loads[target] += costs[key]
+    return [0 if key is None else owners[key] for key in keys]
+
+
+def shard_plan(plan: List[Dict], index: int, total: int, latencies: Optional[Dict[Key, float]] = None) -> List[Dict]:
+    owners = assign_shards(plan, total, latencies)
+    return [dict(ep, index=position) for position, (ep, owner) in enumerate(zip(plan, owners), 1) if owner in (0, index)]
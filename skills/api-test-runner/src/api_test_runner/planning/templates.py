@@ -0,0 +1,34 @@
+import re
+from typing import Dict, List
+
+PARAM = re.compile(r"\{([^}/]+)\}|:([A-Za-z_]\w*)")
+
+
+def param_keys(name: str) -> List[str]:
+    if name.lower() != "id" and name.lower().endswith("id"):
+        return [name, "id"]
+    return [name]
+
+
+def compile_path(path: str) -> Dict:
+    parts: List[str] = []
+    slots: List[List] = []
+    resource = ""
+    last = 0
+    for match in PARAM.finditer(path):
+        literal = path[last : match.start()]
+        segments = [segment for segment in literal.split("/") if segment]
+        if segments:
+            resource = segments[-1]
+        parts.append(literal)
+        name = match.group(1) or match.group(2)
+        slots.append([resource, param_keys(name), match.group(0)])
+        last = match.end()
+    tail = path[last:]
+    parts.append(tail)
+    segments = [segment for segment in tail.split("/") if segment]
+    return {"parts": parts, "slots": slots, "resource": segments[-1] if segments else resource}
+
+
+def template_key(path: str) -> str:
+    return PARAM.sub("{}", path)
@@ -0,0 +1,131 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+TRACE_FILE = "profile.trace.json"
+SUMMARY_FILE = "profile.txt"
+PSTATS_FILE = "profile.pstats"
+
+
+class Profiler:
+    def __init__(self) -> None:
+        self.origin = time.perf_counter_ns()
+        self.events: List[Dict] = []
+        self.counters: Dict[str, int] = {}
+        self.depth = 0
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        began = time.perf_counter_ns()
+        self.depth += 1
+        try:
+            yield
+        finally:
+            self.depth -= 1
+            ended = time.perf_counter_ns()
+            with self.lock:
+                self.events.append(
+                    {
+                        "name": name,
+                        "ts": (began - self.origin) / 1000,
+                        "dur": (ended - began) / 1000,
+                        "depth": self.depth,
+                        "tid": threading.get_ident(),
+                        "counters": dict(self.counters),
+                    }
+                )
+
+    def count(self, name: str, amount: int = 1) -> None:
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def wall_ms(self) -> float:
+        return (time.perf_counter_ns() - self.origin) / 1e6
+
+    def trace(self) -> Dict:
+        pid = os.getpid()
+        events: List[Dict] = [
+            {"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": "api-test-runner"}}
+        ]
+        for event in sorted(self.events, key=lambda item: item["ts"]):
+            events.append(
+                {
+                    "name": event["name"],
+                    "cat": "stage",
+                    "ph": "X",
+                    "ts": event["ts"],
+                    "dur": event["dur"],
+                    "pid": pid,
+                    "tid": event["tid"],
+                }
+            )
+            if event["counters"]:
+                events.append(
+                    {
+                        "name": "counters",
+                        "ph": "C",
+                        "ts": event["ts"] + event["dur"],
+                        "pid": pid,
+                        "args": event["counters"],
+                    }
+                )
+        return {"traceEvents": events, "displayTimeUnit": "ms", "otherData": {"counters": dict(self.counters)}}
+
+    def summary(self) -> str:
+        wall = self.wall_ms()
+        totals: Dict[str, List[float]] = {}
+        order: List[str] = []
+        depths: Dict[str, int] = {}
+        for event in sorted(self.events, key=lambda item: item["ts"]):
+            if event["name"] not in totals:
+                order.append(event["name"])
+                totals[event["name"]] = [0, 0.0]
+                depths[event["name"]] = event["depth"]
+            totals[event["name"]][0] += 1
+            totals[event["name"]][1] += event["dur"] / 1000
+        lines = [f"Wall time: {wall:.1f} ms", "", f"{'Stage':<40} {'Calls':>6} {'Total (ms)':>12} {'% wall':>7}"]
+        for name in order:
+            calls, total = totals[name]
+            label = "  " * depths[name] + name
+            share = total / wall * 100 if wall else 0
+            lines.append(f"{label:<40} {calls:>6} {total:>12.2f} {share:>6.1f}%")
+        if self.counters:
+            lines.extend(["", f"{'Counter':<40} {'Value':>12}"])
+            for name in sorted(self.counters):
+                lines.append(f"{name:<40} {self.counters[name]:>12}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, directory: str) -> Dict[str, str]:
+        os.makedirs(directory, exist_ok=True)
+        paths = {"trace": os.path.join(directory, TRACE_FILE), "summary": os.path.join(directory, SUMMARY_FILE)}
+        with open(paths["trace"], "w", encoding="utf-8") as handle:
+            json.dump(self.trace(), handle)
+        with open(paths["summary"], "w", encoding="utf-8") as handle:
+            handle.write(self.summary())
+        return paths
+
+
+_ACTIVE: Optional[Profiler] = None
+
+
+def activate(profiler: Optional[Profiler]) -> None:
+    global _ACTIVE
+    _ACTIVE = profiler
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    if _ACTIVE is None:
+        yield
+        return
+    with _ACTIVE.stage(name):
+        yield
+
+
+def count(name: str, amount: int = 1) -> None:
+    if _ACTIVE is not None:
+        _ACTIVE.count(name, amount)
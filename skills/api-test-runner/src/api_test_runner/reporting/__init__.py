@@ -1,3 +1,34 @@
-from .report import format_json_report, format_markdown_report
+from .baseline import compare_samples, format_compare_markdown, list_baselines, merge_samples, save_baseline
+from .merge import merge_results, write_merged_report
+from .report import (
+    format_bench_markdown,
+    format_json_report,
+    format_markdown_report,
+    iter_journal,
+    journal_path_for,
+    lifecycle_path_for,
+    load_lifecycle,
+    rebuild_reports,
+    write_json_report,
+    write_markdown_report,
+)
 
-__all__ = ["format_json_report", "format_markdown_report"]
+__all__ = [
+    "compare_samples",
+    "format_compare_markdown",
+    "format_bench_markdown",
+    "format_json_report",
+    "format_markdown_report",
+    "iter_journal",
+    "journal_path_for",
+    "lifecycle_path_for",
+    "list_baselines",
+    "load_lifecycle",
+    "merge_results",
+    "merge_samples",
+    "rebuild_reports",
+    "save_baseline",
+    "write_json_report",
+    "write_markdown_report",
+    "write_merged_report",
+]
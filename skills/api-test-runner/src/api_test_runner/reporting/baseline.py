@@ -0,0 +1,183 @@
+import json
+import math
+import os
+import shutil
+import statistics
+import time
+from typing import Dict, List, Optional, Tuple
+
+BASELINE_DIR = os.path.join(".api-test-runner", "baselines")
+DEFAULT_SAMPLES = 5
+DEFAULT_KEEP = 20
+DEFAULT_THRESHOLD_PCT = 20.0
+DEFAULT_THRESHOLD_MS = 5.0
+DEFAULT_ALPHA = 0.05
+MIN_TEST_SAMPLES = 3
+
+Key = Tuple[str, str]
+
+
+def baseline_dir_for(project_root: str, config: Dict) -> str:
+    directory = (config.get("baseline") or {}).get("dir") or BASELINE_DIR
+    return os.path.join(project_root, directory)
+
+
+def list_baselines(directory: str) -> List[str]:
+    try:
+        names = sorted(name for name in os.listdir(directory) if name.endswith(".json"))
+    except OSError:
+        return []
+    return [os.path.join(directory, name) for name in names]
+
+
+def save_baseline(directory: str, report_json: str, keep: int = DEFAULT_KEEP) -> str:
+    os.makedirs(directory, exist_ok=True)
+    stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime(os.path.getmtime(report_json)))
+    target = os.path.join(directory, f"{stamp}-{os.path.basename(report_json)}")
+    suffix = 1
+    while os.path.exists(target):
+        target = os.path.join(directory, f"{stamp}.{suffix}-{os.path.basename(report_json)}")
+        suffix += 1
+    shutil.copyfile(report_json, target)
+    stored = list_baselines(directory)
+    for path in stored[: max(0, len(stored) - keep)]:
+        os.remove(path)
+    return target
+
+
+def load_report(path: str) -> Dict:
+    with open(path, "r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def report_samples(report: Dict) -> Dict[Key, List[float]]:
+    samples: Dict[Key, List[float]] = {}
+    for item in report.get("results") or []:
+        if item.get("skipped") or not item.get("status"):
+            continue
+        key = (item.get("method", "GET"), item.get("template") or item.get("path", ""))
+        samples.setdefault(key, []).append(float(item.get("latency_ms") or 0))
+    for item in report.get("endpoints") or []:
+        if item.get("p50_ms") is None:
+            continue
+        key = (item.get("method", "GET"), item.get("path", ""))
+        samples.setdefault(key, []).append(float(item["p50_ms"]))
+    return samples
+
+
+def merge_samples(reports: List[Dict]) -> Dict[Key, List[float]]:
+    merged: Dict[Key, List[float]] = {}
+    for report in reports:
+        for key, values in report_samples(report).items():
+            merged.setdefault(key, []).extend(values)
+    return merged
+
+
+def normal_sf(z: float) -> float:
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def mann_whitney_p(baseline: List[float], current: List[float]) -> float:
+    ranked = sorted([(value, 0) for value in baseline] + [(value, 1) for value in current])
+    ranks = [0.0] * len(ranked)
+    ties = 0.0
+    start = 0
+    while start < len(ranked):
+        end = start
+        while end + 1 < len(ranked) and ranked[end + 1][0] == ranked[start][0]:
+            end += 1
+        for pos in range(start, end + 1):
+            ranks[pos] = (start + end) / 2 + 1
+        size = end - start + 1
+        ties += size ** 3 - size
+        start = end + 1
+    n1, n2 = len(baseline), len(current)
+    rank_sum = sum(rank for rank, (_, side) in zip(ranks, ranked) if side == 1)
+    u = rank_sum - n2 * (n2 + 1) / 2
+    total = n1 + n2
+    variance = n1 * n2 / 12 * ((total + 1) - ties / (total * (total - 1)))
+    if variance <= 0:
+        return 1.0
+    return normal_sf((u - n1 * n2 / 2 - 0.5) / math.sqrt(variance))
+
+
+def regression_p(baseline: List[float], current: List[float]) -> Optional[float]:
+    if len(baseline) >= MIN_TEST_SAMPLES and len(current) >= MIN_TEST_SAMPLES:
+        return mann_whitney_p(baseline, current)
+    if len(baseline) >= MIN_TEST_SAMPLES:
+        spread = statistics.stdev(baseline)
+        delta = statistics.median(current) - statistics.mean(baseline)
+        if spread == 0:
+            return 0.0 if delta > 0 else 1.0
+        return normal_sf(delta / (spread * math.sqrt(1 / len(current) + 1 / len(baseline))))
+    return None
+
+
+def compare_samples(
+    baseline: Dict[Key, List[float]],
+    current: Dict[Key, List[float]],
+    threshold_pct: float = DEFAULT_THRESHOLD_PCT,
+    threshold_ms: float = DEFAULT_THRESHOLD_MS,
+    alpha: float = DEFAULT_ALPHA,
+) -> List[Dict]:
+    rows = []
+    for key in sorted(set(baseline) | set(current)):
+        method, path = key
+        row: Dict = {"method": method, "path": path}
+        base_values = baseline.get(key) or []
+        cur_values = current.get(key) or []
+        if not cur_values:
+            row["status"] = "missing"
+        elif not base_values:
+            row["status"] = "new"
+        else:
+            base_median = statistics.median(base_values)
+            cur_median = statistics.median(cur_values)
+            delta = cur_median - base_median
+            delta_pct = delta / base_median * 100 if base_median else (math.inf if delta > 0 else 0.0)
+            p_value = regression_p(base_values, cur_values)
+            row.update(
+                {
+                    "baseline_ms": round(base_median, 3),
+                    "current_ms": round(cur_median, 3),
+                    "delta_ms": round(delta, 3),
+                    "delta_pct": round(delta_pct, 1) if math.isfinite(delta_pct) else None,
+                    "baseline_samples": len(base_values),
+                    "current_samples": len(cur_values),
+                    "p_value": None if p_value is None else round(p_value, 4),
+                }
+            )
+            significant = p_value is None or p_value < alpha
+            if delta > threshold_ms and delta_pct > threshold_pct and significant:
+                row["status"] = "regression"
+            elif -delta > threshold_ms and -delta_pct > threshold_pct:
+                row["status"] = "improvement"
+            else:
+                row["status"] = "ok"
+        rows.append(row)
+    return rows
+
+
+def format_compare_markdown(rows: List[Dict], baselines: List[str]) -> str:
+    lines = [
+        "# API Latency Comparison",
+        "",
+        f"Baseline reports: {len(baselines)}",
+        "",
+        "| Method | Path | Baseline (ms) | Current (ms) | Delta (ms) | Delta (%) | p-value | Status |",
+        "| --- | --- | --- | --- | --- | --- | --- | --- |",
+    ]
+    for row in rows:
+        lines.append(
+            "| {method} | {path} | {base} | {cur} | {delta} | {pct} | {p} | {status} |".format(
+                method=row["method"],
+                path=row["path"],
+                base=row.get("baseline_ms", ""),
+                cur=row.get("current_ms", ""),
+                delta=row.get("delta_ms", ""),
+                pct="" if row.get("delta_pct") is None else row["delta_pct"],
+                p="" if row.get("p_value") is None else row["p_value"],
+                status=row["status"],
+            )
+        )
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,28 @@
+import json
+import os
+from typing import Dict, Iterable, List
+
+from .report import journal_path_for, rebuild_reports
+
+
+def merge_results(reports: Iterable[Dict]) -> List[Dict]:
+    indexed: Dict[int, Dict] = {}
+    extra: List[Dict] = []
+    for report in reports:
+        for item in report.get("results") or []:
+            if item.get("index") is None:
+                extra.append(item)
+            else:
+                indexed.setdefault(item["index"], item)
+    return [indexed[key] for key in sorted(indexed)] + extra
+
+
+def write_merged_report(results: List[Dict], report_path: str) -> int:
+    journal = journal_path_for(report_path)
+    os.makedirs(os.path.dirname(os.path.abspath(journal)), exist_ok=True)
+    tmp_path = journal + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as handle:
+        for item in results:
+            handle.write(json.dumps(item) + "\n")
+    os.replace(tmp_path, journal)
+    return rebuild_reports(journal, report_path)
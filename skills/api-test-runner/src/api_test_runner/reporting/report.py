@@ -1,12 +1,95 @@
+import io
 import json
-from typing import Dict, List
+import os
+import textwrap
+from typing import IO, Dict, Iterable, Iterator, List, Optional
 
+PHASES = ("dns", "connect", "tls", "ttfb", "download", "total")
+JOURNAL_SUFFIX = ".journal.jsonl"
+LIFECYCLE_SUFFIX = ".lifecycle.json"
+LIFECYCLE_FIELDS = ("command", "source", "spawn_ms", "cold_start_ms", "time_to_ready_ms", "probes", "health_url", "stop_ms", "exit_code")
 
-def format_markdown_report(results: List[Dict]) -> str:
-    lines = ["# API Test Report", "", "| Method | Path | Status | Latency (ms) | Notes |", "| --- | --- | --- | --- | --- |"]
+
+class PhaseSummary:
+    def __init__(self) -> None:
+        self.count = 0
+        self.totals = dict.fromkeys(PHASES, 0.0)
+        self.maxima = dict.fromkeys(PHASES, 0.0)
+
+    def add(self, item: Dict) -> None:
+        timings = item.get("timings")
+        if not timings:
+            return
+        self.count += 1
+        for name in PHASES:
+            value = timings.get(f"{name}_ms", 0)
+            self.totals[name] += value
+            self.maxima[name] = max(self.maxima[name], value)
+
+    def result(self) -> Dict[str, Dict[str, float]]:
+        if not self.count:
+            return {}
+        return {
+            name: {"mean_ms": round(self.totals[name] / self.count, 3), "max_ms": self.maxima[name]}
+            for name in PHASES
+        }
+
+
+def summarize_phases(results: Iterable[Dict]) -> Dict[str, Dict[str, float]]:
+    summary = PhaseSummary()
     for item in results:
-        lines.append(
-            "| {method} | {path} | {status} | {latency} | {notes} |".format(
+        summary.add(item)
+    return summary.result()
+
+
+def journal_path_for(report_path: str) -> str:
+    base = report_path[:-3] if report_path.endswith(".md") else report_path
+    return base + JOURNAL_SUFFIX
+
+
+def lifecycle_path_for(report_path: str) -> str:
+    base = report_path[:-3] if report_path.endswith(".md") else report_path
+    return base + LIFECYCLE_SUFFIX
+
+
+def load_lifecycle(report_path: str) -> Optional[Dict]:
+    try:
+        with open(lifecycle_path_for(report_path), "r", encoding="utf-8") as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return None
+
+
+def iter_journal(path: str) -> Iterator[Dict]:
+    try:
+        handle = open(path, "r", encoding="utf-8")
+    except OSError:
+        return
+    with handle:
+        for line in handle:
+            if not line.endswith("\n"):
+                return
+            try:
+                yield json.loads(line)
+            except ValueError:
+                return
+
+
+def ordered_journal(path: str) -> Iterable[Dict]:
+    previous = 0
+    for item in iter_journal(path):
+        if item.get("index", 0) < previous:
+            return sorted(iter_journal(path), key=lambda entry: entry.get("index", 0))
+        previous = item.get("index", 0)
+    return iter_journal(path)
+
+
+def write_markdown_report(results: Iterable[Dict], handle: IO[str], lifecycle: Optional[Dict] = None) -> None:
+    handle.write("# API Test Report\n\n| Method | Path | Status | Latency (ms) | Notes |\n| --- | --- | --- | --- | --- |\n")
+    summary = PhaseSummary()
+    for item in results:
+        handle.write(
+            "| {method} | {path} | {status} | {latency} | {notes} |\n".format(
                 method=item.get("method", ""),
                 path=item.get("path", ""),
                 status=item.get("status", ""),
@@ -14,8 +97,88 @@ def format_markdown_report(results: List[Dict]) -> str:
                 notes=item.get("notes", ""),
             )
         )
-    return "\n".join(lines) + "\n"
+        summary.add(item)
+    phase_summary = summary.result()
+    if phase_summary:
+        handle.write("\n## Phase Timings (ms)\n\n| Phase | Mean | Max |\n| --- | --- | --- |\n")
+        for name, stats in phase_summary.items():
+            handle.write("| {name} | {mean} | {max} |\n".format(name=name, mean=stats["mean_ms"], max=stats["max_ms"]))
+    if lifecycle:
+        handle.write("\n## Backend Lifecycle\n\n| Metric | Value |\n| --- | --- |\n")
+        for key in LIFECYCLE_FIELDS:
+            if key in lifecycle:
+                handle.write("| {key} | {value} |\n".format(key=key, value=lifecycle[key]))
+
+
+def write_json_report(results: Iterable[Dict], handle: IO[str], lifecycle: Optional[Dict] = None) -> None:
+    summary = PhaseSummary()
+    handle.write('{\n  "results": [')
+    first = True
+    for item in results:
+        handle.write("\n" if first else ",\n")
+        handle.write(textwrap.indent(json.dumps(item, indent=2), "    "))
+        summary.add(item)
+        first = False
+    handle.write("]" if first else "\n  ]")
+    summary_json = json.dumps({"phases": summary.result()}, indent=2).replace("\n", "\n  ")
+    handle.write(',\n  "summary": ' + summary_json)
+    if lifecycle:
+        handle.write(',\n  "lifecycle": ' + json.dumps(lifecycle, indent=2).replace("\n", "\n  "))
+    handle.write("\n}")
+
+
+def format_markdown_report(results: List[Dict]) -> str:
+    buffer = io.StringIO()
+    write_markdown_report(results, buffer)
+    return buffer.getvalue()
 
 
 def format_json_report(results: List[Dict]) -> str:
-    return json.dumps({"results": results}, indent=2)
+    buffer = io.StringIO()
+    write_json_report(results, buffer)
+    return buffer.getvalue()
+
+
+def rebuild_reports(journal_path: str, report_path: str) -> int:
+    os.makedirs(os.path.dirname(os.path.abspath(report_path)), exist_ok=True)
+    json_path = report_path[:-3] + ".json" if report_path.endswith(".md") else report_path + ".json"
+    lifecycle = load_lifecycle(report_path)
+    for target, writer in ((report_path, write_markdown_report), (json_path, write_json_report)):
+        tmp_path = target + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            writer(ordered_journal(journal_path), handle, lifecycle)
+        os.replace(tmp_path, target)
+    return sum(1 for _ in iter_journal(journal_path))
+
+
+def format_bench_markdown(summary: Dict) -> str:
+    overall = summary.get("overall") or {}
+    lines = [
+        "# API Benchmark Report",
+        "",
+        "Duration: {duration} s, concurrency: {concurrency}, requests: {requests}, rps: {rps}, error rate: {error_rate}".format(
+            duration=summary.get("duration_s", ""),
+            concurrency=summary.get("concurrency", ""),
+            requests=overall.get("requests", 0),
+            rps=overall.get("rps", 0),
+            error_rate=overall.get("error_rate", 0),
+        ),
+        "",
+        "| Method | Path | Requests | RPS | Errors | p50 (ms) | p90 (ms) | p99 (ms) | Max (ms) |",
+        "| --- | --- | --- | --- | --- | --- | --- | --- | --- |",
+    ]
+    for item in summary.get("endpoints") or []:
+        lines.append(
+            "| {method} | {path} | {requests} | {rps} | {errors} | {p50} | {p90} | {p99} | {max} |".format(
+                method=item.get("method", ""),
+                path=item.get("path", ""),
+                requests=item.get("requests", 0),
+                rps=item.get("rps", 0),
+                errors=item.get("errors", 0),
+                p50=item.get("p50_ms", ""),
+                p90=item.get("p90_ms", ""),
+                p99=item.get("p99_ms", ""),
+                max=item.get("max_ms", ""),
+            )
+        )
+    return "\n".join(lines) + "\n"
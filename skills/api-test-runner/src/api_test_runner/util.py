@@ -1,7 +1,11 @@
 import json
+import mmap
 import os
 import re
-from typing import Dict, Iterable, List, Optional
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+from .inventory import build_inventory
 
 SECRET_KEYS = {
     "password",
@@ -14,14 +18,49 @@ SECRET_KEYS = {
 }
 
 
-def read_text(path: str, max_bytes: int = 512 * 1024) -> str:
+def read_text(path: str, max_bytes: Optional[int] = None) -> str:
     try:
         with open(path, "r", encoding="utf-8", errors="replace") as handle:
-            return handle.read(max_bytes)
+            return handle.read(-1 if max_bytes is None else max_bytes)
     except OSError:
         return ""
 
 
+@contextmanager
+def mapped_file(path: str) -> Iterator[Union[bytes, mmap.mmap]]:
+    try:
+        handle = open(path, "rb")
+    except OSError:
+        yield b""
+        return
+    with handle:
+        try:
+            size = os.fstat(handle.fileno()).st_size
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        except (OSError, ValueError):
+            yield handle.read()
+            return
+        if mapped is None:
+            yield b""
+            return
+        try:
+            yield mapped
+        finally:
+            try:
+                mapped.close()
+            except BufferError:
+                pass
+
+
+def iter_lines(path: str) -> Iterator[str]:
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as handle:
+            for line in handle:
+                yield line.rstrip("\r\n")
+    except OSError:
+        return
+
+
 def read_json(path: str) -> Optional[Dict]:
     try:
         with open(path, "r", encoding="utf-8") as handle:
@@ -30,32 +69,21 @@ def read_json(path: str) -> Optional[Dict]:
         return None
 
 
-def find_files(root: str, names: Iterable[str]) -> List[str]:
-    hits: List[str] = []
-    names_set = set(names)
-    for base, dirs, files in os.walk(root):
-        dirs[:] = [d for d in dirs if d not in {"node_modules", "target", "build", "dist", ".git"}]
-        for filename in files:
-            if filename in names_set:
-                hits.append(os.path.join(base, filename))
-    return hits
+def find_files(root: str, names: Iterable[str], prune: Optional[Iterable[str]] = None) -> List[str]:
+    return build_inventory(root, prune).find(names)
 
 
-def find_files_by_ext(root: str, exts: Iterable[str]) -> List[str]:
-    hits: List[str] = []
-    exts_set = set(exts)
-    for base, dirs, files in os.walk(root):
-        dirs[:] = [d for d in dirs if d not in {"node_modules", "target", "build", "dist", ".git"}]
-        for filename in files:
-            _, ext = os.path.splitext(filename)
-            if ext in exts_set:
-                hits.append(os.path.join(base, filename))
-    return hits
+def find_files_by_ext(root: str, exts: Iterable[str], prune: Optional[Iterable[str]] = None) -> List[str]:
+    return build_inventory(root, prune).find_by_ext(exts)
 
 
 def parse_env_text(text: str) -> Dict[str, str]:
+    return parse_env_lines(text.splitlines())
+
+
+def parse_env_lines(lines: Iterable[str]) -> Dict[str, str]:
     result: Dict[str, str] = {}
-    for line in text.splitlines():
+    for line in lines:
         line = line.strip()
         if not line or line.startswith("#") or "=" not in line:
             continue
@@ -0,0 +1,179 @@
+import os
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from .cache import DiscoveryCache
+from .discovery.endpoints import extract_openapi_file, extract_source_file
+from .discovery.extractors import ENGINE
+from .discovery.openapi import OPENAPI_FILES, OpenApiIndex, index_for_file
+from .inventory import FileEntry, Inventory, build_inventory
+from .planning import compile_path, infer_order, is_auth_path, is_health_path, template_key
+
+DEFAULT_INTERVAL = 0.5
+
+Key = Tuple[str, str]
+
+
+def endpoint_key(ep: Dict) -> Key:
+    return (ep.get("method", "GET"), template_key(ep.get("template") or ep.get("path") or ""))
+
+
+class SourceMap:
+    def __init__(self, project_root: str, prune: Optional[Iterable[str]] = None):
+        self.project_root = project_root
+        self.prune = list(prune) if prune is not None else None
+        self.stamps: Dict[str, Tuple[float, int]] = {}
+        self.by_file: Dict[str, List[Dict]] = {}
+        self.specs: Dict[str, OpenApiIndex] = {}
+
+    def is_spec(self, path: str) -> bool:
+        return os.path.basename(path) in OPENAPI_FILES
+
+    def tracked(self, inventory: Inventory) -> Dict[str, FileEntry]:
+        exts = set(ENGINE.exts)
+        return {
+            entry.path: entry for entry in inventory.entries if entry.name in OPENAPI_FILES or entry.ext in exts
+        }
+
+    def load(self, inventory: Optional[Inventory] = None, cache: Optional[DiscoveryCache] = None) -> List[str]:
+        if inventory is None:
+            inventory = build_inventory(self.project_root, self.prune)
+        files = self.tracked(inventory)
+        for path, entry in files.items():
+            kind = "openapi" if self.is_spec(path) else "endpoints"
+            found = cache.lookup(kind, entry) if cache else None
+            if found is None:
+                found = self.extract(path)
+                if cache:
+                    cache.store(kind, entry, found)
+            if self.is_spec(path):
+                data = cache.lookup("openapi_index", entry) if cache else None
+                if data is not None:
+                    self.specs[path] = OpenApiIndex.from_dict(data)
+                else:
+                    self.specs[path] = index_for_file(path)
+                    if cache:
+                        cache.store("openapi_index", entry, self.specs[path].to_dict())
+            self.by_file[path] = found
+            self.stamps[path] = (entry.mtime, entry.size)
+        return list(files)
+
+    def extract(self, path: str) -> List[Dict]:
+        try:
+            if self.is_spec(path):
+                found = extract_openapi_file(path)
+                self.specs[path] = index_for_file(path)
+                return found
+            return extract_source_file(path)
+        except (OSError, ValueError):
+            return []
+
+    def poll(self) -> List[str]:
+        files = self.tracked(build_inventory(self.project_root, self.prune))
+        changed = [path for path, entry in files.items() if self.stamps.get(path) != (entry.mtime, entry.size)]
+        changed.extend(path for path in self.stamps if path not in files)
+        for path in changed:
+            if path in files:
+                self.by_file[path] = self.extract(path)
+                self.stamps[path] = (files[path].mtime, files[path].size)
+            else:
+                self.by_file.pop(path, None)
+                self.specs.pop(path, None)
+                self.stamps.pop(path, None)
+        return sorted(changed)
+
+    def defined_by(self, paths: Iterable[str]) -> List[Dict]:
+        return [ep for path in paths for ep in self.by_file.get(path, [])]
+
+    def endpoints(self) -> List[Dict]:
+        deduped: Dict[Key, Dict] = {}
+        for path in sorted(self.by_file, key=lambda item: (not self.is_spec(item), item)):
+            for ep in self.by_file[path]:
+                deduped[endpoint_key(ep)] = ep
+        return list(deduped.values())
+
+    def indexes(self) -> List[OpenApiIndex]:
+        return [self.specs[path] for path in sorted(self.specs)]
+
+
+def select_affected(endpoints: List[Dict], keys: Set[Key]) -> List[Dict]:
+    compiled = [compile_path(ep.get("path", "")) for ep in endpoints]
+    creates: Dict[str, List[int]] = {}
+    for pos, ep in enumerate(endpoints):
+        if ep.get("method") == "POST":
+            creates.setdefault(compiled[pos]["resource"], []).append(pos)
+    chosen: Set[int] = set()
+    stack = [pos for pos, ep in enumerate(endpoints) if endpoint_key(ep) in keys]
+    while stack:
+        pos = stack.pop()
+        if pos in chosen:
+            continue
+        chosen.add(pos)
+        for resource, _, _ in compiled[pos]["slots"]:
+            stack.extend(creates.get(resource, []))
+    if not chosen:
+        return []
+    return [
+        ep
+        for pos, ep in enumerate(endpoints)
+        if pos in chosen or is_health_path(ep.get("path", "")) or is_auth_path(ep.get("path", ""))
+    ]
+
+
+class Watcher:
+    def __init__(
+        self,
+        source_map: SourceMap,
+        config: Dict,
+        build: Callable[[List[Dict]], List[Dict]],
+        execute: Callable[[List[Dict]], List[Dict]],
+    ):
+        self.source_map = source_map
+        self.config = config
+        self.build = build
+        self.execute = execute
+        self.latest: Dict[Key, Dict] = {}
+
+    def cycle(self, changed: Optional[List[str]] = None) -> Optional[Dict]:
+        began = time.perf_counter()
+        if changed is None:
+            changed = self.source_map.poll()
+        if not changed:
+            return None
+        endpoints = self.source_map.endpoints()
+        current = {endpoint_key(ep) for ep in endpoints}
+        removed = [self.latest.pop(key) for key in sorted(self.latest) if key not in current]
+        keys = {endpoint_key(ep) for ep in self.source_map.defined_by(changed)}
+        plan = self.build(select_affected(infer_order(endpoints, self.config), keys))
+        results = self.execute(plan) if plan else []
+        for item in results:
+            self.latest[endpoint_key(item)] = item
+        return {
+            "changed": changed,
+            "plan": plan,
+            "results": results,
+            "removed": removed,
+            "elapsed_ms": round((time.perf_counter() - began) * 1000, 1),
+        }
+
+    def failing(self) -> List[Dict]:
+        return [item for item in self.latest.values() if not item.get("status") or item["status"] >= 400]
+
+
+def format_cycle(summary: Dict, watcher: Watcher) -> str:
+    changed = [os.path.relpath(path, watcher.source_map.project_root) for path in summary["changed"]]
+    more = f" (+{len(changed) - 5} more)" if len(changed) > 5 else ""
+    lines = [time.strftime("[%H:%M:%S] ") + f"{len(changed)} changed file(s): " + ", ".join(changed[:5]) + more]
+    for item in summary["removed"]:
+        lines.append(f"  removed: {item.get('method')} {item.get('template') or item.get('path')}")
+    if summary["results"]:
+        lines.append(f"  {'Method':<7} {'Path':<48} {'Status':>6} {'ms':>8}  Notes")
+        for item in summary["results"]:
+            lines.append(
+                f"  {item.get('method', ''):<7} {item.get('path', ''):<48} {item.get('status', 0):>6} "
+                f"{item.get('latency_ms', 0):>8}  {item.get('notes', '')}"
+            )
+    failing = [f"{item.get('method')} {item.get('template') or item.get('path')}" for item in watcher.failing()]
+    status = f"{len(failing)} failing: " + ", ".join(failing[:5]) if failing else "all passing"
+    lines.append(f"  Re-tested {len(summary['results'])} of {len(watcher.latest)} endpoints in {summary['elapsed_ms']} ms; {status}")
+    return "\n".join(lines)
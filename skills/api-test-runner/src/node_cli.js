@@ -62,18 +62,28 @@ function buildPlan(endpoints) {
   });
 }
 
+function writePlan(planPath, plan, header) {
+  const lines = [JSON.stringify(header)].concat(plan.map((entry) => JSON.stringify(entry)));
+  const tmpPath = planPath + ".tmp";
+  fs.writeFileSync(tmpPath, lines.join("\n") + "\n");
+  fs.renameSync(tmpPath, planPath);
+  return planPath;
+}
+
 function generateRunner(plan, config, projectRoot, reportPath) {
   const templatePath = path.join(__dirname, "..", "templates", "runner_js.tmpl");
   const template = fs.readFileSync(templatePath, "utf-8");
-  const payload = {
-    plan,
+  const outDir = path.join(projectRoot, ".api-test-runner");
+  fs.mkdirSync(outDir, { recursive: true });
+  const header = {
     config,
     report_path: reportPath,
     artifacts_dir: path.join(projectRoot, "artifacts"),
+    entries: plan.length,
   };
-  const rendered = template.replace("{{PAYLOAD_JSON}}", JSON.stringify(payload, null, 2));
-  const outDir = path.join(projectRoot, ".api-test-runner");
-  fs.mkdirSync(outDir, { recursive: true });
+  const planFile = "generated_runner.plan.jsonl";
+  writePlan(path.join(outDir, planFile), plan, header);
+  const rendered = template.replace("{{PLAN_FILE}}", JSON.stringify(planFile));
   const outPath = path.join(outDir, "generated_runner.js");
   fs.writeFileSync(outPath, rendered);
   return outPath;
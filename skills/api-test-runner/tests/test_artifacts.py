@@ -0,0 +1,55 @@
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from api_test_runner.artifacts import iter_artifacts, read_artifact
+from api_test_runner.execution import Engine
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        data = json.dumps({"path": self.path, "text": "é" * len(self.path)}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestArtifactStore(unittest.TestCase):
+    def test_runner_output_lookup_by_offset(self):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        plan = [{"method": "GET", "path": f"/items/{idx}"} for idx in range(1, 4)]
+        try:
+            for compression in (None, "gzip"):
+                with tempfile.TemporaryDirectory() as tmpdir:
+                    artifacts_dir = os.path.join(tmpdir, "artifacts")
+                    config = {
+                        "baseUrl": f"http://127.0.0.1:{server.server_address[1]}",
+                        "retries": 0,
+                        "artifactCompression": compression,
+                    }
+                    Engine(plan, config, os.path.join(tmpdir, "reports", "api-test-report.md"), artifacts_dir).run()
+                    self.assertEqual(read_artifact(artifacts_dir, 2)["path"], "/items/2")
+                    self.assertEqual(json.loads(read_artifact(artifacts_dir, 3)["response"])["text"], "é" * 8)
+                    self.assertIsNone(read_artifact(artifacts_dir, 9))
+                    self.assertEqual([r["index"] for r in iter_artifacts(artifacts_dir)], [1, 2, 3])
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from api_test_runner.reporting import compare_samples, list_baselines, merge_samples, save_baseline
+from api_test_runner.reporting.baseline import mann_whitney_p, report_samples
+
+
+def run_report(latencies):
+    return {
+        "results": [
+            {"method": "GET", "path": f"/users/{index}", "template": "/users/{id}", "status": 200, "latency_ms": value}
+            for index, value in enumerate(latencies)
+        ]
+    }
+
+
+class TestBaseline(unittest.TestCase):
+    def test_samples_keyed_by_template(self):
+        report = run_report([10, 12])
+        report["results"].append({"method": "GET", "path": "/down", "status": 0, "latency_ms": 0, "skipped": True})
+        bench = {"endpoints": [{"method": "GET", "path": "/users/{id}", "p50_ms": 11.0}]}
+        self.assertEqual(merge_samples([report, bench]), {("GET", "/users/{id}"): [10.0, 12.0, 11.0]})
+        legacy = {"results": [{"method": "POST", "path": "/users", "status": 201, "latency_ms": 3}]}
+        self.assertEqual(report_samples(legacy), {("POST", "/users"): [3.0]})
+
+    def test_regression_needs_threshold_and_significance(self):
+        baseline = merge_samples([run_report([10, 11, 9, 10, 10])])
+        rows = compare_samples(baseline, merge_samples([run_report([30])]))
+        self.assertEqual(rows[0]["status"], "regression")
+        self.assertLess(rows[0]["p_value"], 0.05)
+        self.assertEqual(compare_samples(baseline, merge_samples([run_report([13])]))[0]["status"], "ok")
+        noisy = merge_samples([run_report([5, 60, 8, 55, 10])])
+        self.assertEqual(compare_samples(noisy, merge_samples([run_report([40])]))[0]["status"], "ok")
+        self.assertEqual(compare_samples(baseline, merge_samples([run_report([2])]))[0]["status"], "improvement")
+
+    def test_single_baseline_uses_thresholds_only(self):
+        rows = compare_samples(merge_samples([run_report([10])]), merge_samples([run_report([20])]))
+        self.assertIsNone(rows[0]["p_value"])
+        self.assertEqual(rows[0]["status"], "regression")
+        rows = compare_samples(merge_samples([run_report([10])]), {("GET", "/new"): [1.0]})
+        self.assertEqual([row["status"] for row in rows], ["new", "missing"])
+
+    def test_mann_whitney(self):
+        self.assertLess(mann_whitney_p([10, 11, 12, 10, 11], [20, 21, 22, 19, 20]), 0.01)
+        self.assertGreater(mann_whitney_p([10, 11, 12, 10, 11], [10, 12, 11, 11, 10]), 0.3)
+        self.assertEqual(mann_whitney_p([5, 5, 5], [5, 5, 5]), 1.0)
+
+    def test_store_keeps_latest(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            report = os.path.join(tmpdir, "api-test-report.json")
+            store = os.path.join(tmpdir, "baselines")
+            for offset in range(3):
+                with open(report, "w", encoding="utf-8") as handle:
+                    json.dump(run_report([offset]), handle)
+                os.utime(report, (1000000000 + offset, 1000000000 + offset))
+                save_baseline(store, report, keep=2)
+            save_baseline(store, report, keep=2)
+            stored = list_baselines(store)
+            self.assertEqual(len(stored), 2)
+            with open(stored[-1], encoding="utf-8") as handle:
+                self.assertEqual(json.load(handle)["results"][0]["latency_ms"], 2)
+            self.assertNotEqual(stored[0], stored[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "benchmarks")))
+
+from api_test_runner.discovery import discover_endpoints, discover_env
+from synth import generate_project
+
+SIZES = {"spring": 3, "nest": 3, "express": 3, "noise": 4, "openapi": 5, "node_modules": 6, "node_modules_depth": 3, "env": 4}
+
+
+def snapshot(root):
+    files = {}
+    for base, _, names in os.walk(root):
+        for name in names:
+            path = os.path.join(base, name)
+            with open(path, encoding="utf-8") as handle:
+                files[os.path.relpath(path, root)] = handle.read()
+    return files
+
+
+class TestSyntheticProject(unittest.TestCase):
+    def test_deterministic(self):
+        with tempfile.TemporaryDirectory() as first, tempfile.TemporaryDirectory() as second:
+            generate_project(first, SIZES, seed=7)
+            generate_project(second, SIZES, seed=7)
+            self.assertEqual(snapshot(first), snapshot(second))
+
+    def test_discovery_matches_manifest(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manifest = generate_project(tmpdir, SIZES)
+            endpoints = discover_endpoints(tmpdir)
+            self.assertEqual(len(endpoints), manifest["expected_endpoints"])
+            self.assertFalse([ep for ep in endpoints if ep["path"].startswith("/vendored")])
+            self.assertEqual(len(discover_env(tmpdir)["env_files"]), SIZES["env"])
+            with open(os.path.join(tmpdir, "bench-manifest.json"), encoding="utf-8") as handle:
+                self.assertEqual(json.load(handle)["sizes"], SIZES)
+
+
+if __name__ == "__main__":
+    unittest.main()
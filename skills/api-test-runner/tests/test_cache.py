@@ -0,0 +1,48 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from api_test_runner.cache import open_cache
+from api_test_runner.discovery.endpoints import from_source
+from api_test_runner.inventory import build_inventory
+
+
+class TestDiscoveryCache(unittest.TestCase):
+    def write(self, path, text):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(text)
+
+    def test_reuse_and_evict(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            first = os.path.join(tmpdir, "src", "a.ts")
+            second = os.path.join(tmpdir, "src", "b.ts")
+            self.write(first, "router.get('/a', handler)\n")
+            self.write(second, "router.post('/b', handler)\n")
+
+            cache = open_cache(tmpdir)
+            inventory = build_inventory(tmpdir)
+            cold = from_source(tmpdir, inventory, cache)
+            cache.save(inventory)
+            self.assertEqual(cache.misses, 2)
+
+            cache = open_cache(tmpdir)
+            warm = from_source(tmpdir, inventory, cache)
+            self.assertEqual(warm, cold)
+            self.assertEqual((cache.hits, cache.misses), (2, 0))
+
+            os.remove(second)
+            self.write(first, "router.get('/changed', handler)\n")
+            inventory = build_inventory(tmpdir)
+            cache = open_cache(tmpdir)
+            changed = from_source(tmpdir, inventory, cache)
+            cache.save(inventory)
+            self.assertEqual([(e["method"], e["path"]) for e in changed], [("GET", "/changed")])
+            self.assertEqual(list(open_cache(tmpdir).files), [first])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from api_test_runner.cli import build_plan
+from api_test_runner.generation.runner import generate_runner
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def reply(self, body):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self.reply({"id": 42})
+
+    def do_GET(self):
+        self.reply({"id": None, "itemId": None, "path": self.path})
+
+    do_PUT = do_POST
+
+    def log_message(self, *args):
+        pass
+
+
+class TestCrossRunner(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def run_runner(self, runtime, command, tmpdir):
+        plan = build_plan(
+            [
+                {"method": "POST", "path": "/items"},
+                {"method": "GET", "path": "/items/{id}"},
+                {"method": "PUT", "path": "/items/{itemId}"},
+            ],
+            {},
+        )
+        config = {"baseUrl": f"http://127.0.0.1:{self.server.server_address[1]}", "retries": 0}
+        report_path = os.path.join(tmpdir, runtime, "api-test-report.md")
+        runner = os.path.join(tmpdir, runtime, "runner" + (".py" if runtime == "python" else ".js"))
+        generate_runner(plan, config, runtime, runner, report_path, os.path.join(tmpdir, runtime, "artifacts"))
+        subprocess.run([command, runner], check=True, capture_output=True, timeout=60)
+        with open(report_path[:-3] + ".json", encoding="utf-8") as handle:
+            return [item["path"] for item in json.load(handle)["results"]]
+
+    def test_null_ids_do_not_replace_captured_ids(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            expected = ["/items", "/items/42", "/items/42"]
+            self.assertEqual(self.run_runner("python", sys.executable, tmpdir), expected)
+            if shutil.which("node"):
+                self.assertEqual(self.run_runner("node", "node", tmpdir), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,7 +6,9 @@ import unittest
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
 
+from api_test_runner.discovery import endpoints as endpoints_module
 from api_test_runner.discovery.endpoints import discover_endpoints
+from api_test_runner.discovery.extractors import ExtractionEngine, normalize_path
 
 
 class TestEndpointDiscovery(unittest.TestCase):
@@ -24,6 +26,52 @@ class TestEndpointDiscovery(unittest.TestCase):
             self.assertIn(("GET", "/health"), methods)
             self.assertIn(("POST", "/users"), methods)
 
+    def test_parallel_matches_serial(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for idx in range(6):
+                path = os.path.join(tmpdir, f"routes{idx}.ts")
+                with open(path, "w", encoding="utf-8") as handle:
+                    handle.write(f"router.get('/items{idx}', h)\nrouter.post('/items', h)\n")
+            serial = discover_endpoints(tmpdir)
+            original = endpoints_module.PARALLEL_MIN_FILES
+            endpoints_module.PARALLEL_MIN_FILES = 1
+            try:
+                parallel = discover_endpoints(tmpdir, jobs=2)
+            finally:
+                endpoints_module.PARALLEL_MIN_FILES = original
+            self.assertEqual(parallel, serial)
+
+    def test_engine_single_pass_and_plugins(self):
+        engine = ExtractionEngine()
+        engine.register(
+            "fastapi",
+            rb"@(?:app|router)\.(get|post)\(\s*['\"]([^'\"]+)['\"]",
+            lambda groups, state: {"method": groups[0].upper(), "path": normalize_path(groups[1]), "source": "fastapi"},
+            markers=[b"@app.", b"@router."],
+            exts=[".py"],
+        )
+        self.assertEqual(engine.extract(b"def helper():\n    return 1\n"), [])
+        found = engine.extract(b"@app.get('/items')\ndef a(): ...\n@router.post(\"/items\")\ndef b(): ...\n")
+        self.assertEqual([(e["method"], e["path"]) for e in found], [("GET", "/items"), ("POST", "/items")])
+
+    def test_nest_empty_route_and_extension_scoping(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            controller = os.path.join(tmpdir, "items.controller.ts")
+            with open(controller, "w", encoding="utf-8") as handle:
+                handle.write(
+                    "@Controller('items')\nexport class Items {\n"
+                    "  @Get()\n  list() { return []; }\n"
+                    "  @Post()\n  create() { return {}; }\n"
+                    "  @Get(':id')\n  one() { return {}; }\n}\n"
+                )
+            service = os.path.join(tmpdir, "Client.java")
+            with open(service, "w", encoding="utf-8") as handle:
+                handle.write("client.router.get(\"/not-a-route\", h);\n")
+            found = {(e["method"], e["path"]) for e in endpoints_module.extract_source_file(controller)}
+            self.assertEqual(found, {("GET", "/items"), ("POST", "/items"), ("GET", "/items/:id")})
+            found = [(e["method"], e["path"]) for e in endpoints_module.extract_source_file(service)]
+            self.assertEqual(found, [])
+
 
 if __name__ == "__main__":
     unittest.main()
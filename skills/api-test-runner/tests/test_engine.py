@@ -0,0 +1,207 @@
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+import urllib.parse
+from unittest import mock
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from api_test_runner.cli import build_plan
+from api_test_runner.execution import Engine
+from api_test_runner.generation.runner import generate_runner
+from api_test_runner.reporting import journal_path_for
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    hits = {}
+    proxied = []
+
+    def do_GET(self):
+        if self.path.startswith("http://"):
+            Handler.proxied.append(self.path)
+            self.path = urllib.parse.urlsplit(self.path).path
+        if self.path == "/old":
+            self.send_response(302)
+            self.send_header("Location", "/health")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path == "/drop":
+            self.reply(200, {"ok": True})
+            self.close_connection = True
+            return
+        if self.path == "/pause":
+            time.sleep(0.3)
+        count = Handler.hits[self.path] = Handler.hits.get(self.path, 0) + 1
+        if self.path == "/flaky" and count == 1:
+            self.reply(429, {"ok": False}, {"Retry-After": "1"})
+            return
+        status = 200 if self.path in {"/health", "/items/7", "/flaky", "/users/42", "/orders/99", "/pause"} else 404
+        self.reply(status, {"ok": status == 200})
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if self.path == "/orders":
+            time.sleep(0.1)
+        self.reply(201, {"id": {"/users": 42, "/orders": 99}.get(self.path, 7)})
+
+    def reply(self, status, body, extra_headers=None):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        for name, value in (extra_headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestEngine(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_run_in_process(self):
+        plan = [
+            {"method": "GET", "path": "/health"},
+            {"method": "POST", "path": "/items", "payload": {}},
+            {"method": "GET", "path": "/items/{id}"},
+            {"method": "DELETE", "path": "/items/{id}"},
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            report_path = os.path.join(tmpdir, "reports", "api-test-report.md")
+            artifacts_dir = os.path.join(tmpdir, "artifacts")
+            config = {"baseUrl": self.base_url, "retries": 0}
+            results = Engine(plan, config, report_path, artifacts_dir).run()
+            self.assertEqual([(r["index"], r["path"], r["status"]) for r in results], [
+                (1, "/health", 200),
+                (2, "/items", 201),
+                (3, "/items/7", 200),
+            ])
+            self.assertTrue(os.path.exists(report_path))
+
+            deletes_only = [{"method": "DELETE", "path": "/items/{id}"}]
+            self.assertEqual(Engine(deletes_only, config, report_path, artifacts_dir).run(), [])
+
+            runner = os.path.join(tmpdir, ".api-test-runner", "generated_runner.py")
+            generate_runner(plan, config, "python", runner, report_path, artifacts_dir)
+            replay = Engine.from_runner(runner).run()
+            self.assertEqual([r["status"] for r in replay], [r["status"] for r in results])
+
+    def test_concurrent_groups_keep_their_own_ids(self):
+        plan = [
+            {"method": "GET", "path": "/health", "setup": True},
+            {"method": "POST", "path": "/users", "payload": {}, "group": "users"},
+            {"method": "GET", "path": "/pause", "group": "users"},
+            {"method": "GET", "path": "/users/{id}", "group": "users"},
+            {"method": "POST", "path": "/orders", "payload": {}, "group": "orders"},
+            {"method": "GET", "path": "/orders/{id}", "group": "orders"},
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            report_path = os.path.join(tmpdir, "reports", "api-test-report.md")
+            config = {"baseUrl": self.base_url, "retries": 0, "concurrency": 4}
+            results = Engine(plan, config, report_path, os.path.join(tmpdir, "artifacts")).run()
+            self.assertEqual([(r["path"], r["status"]) for r in results], [
+                ("/health", 200),
+                ("/users", 201),
+                ("/pause", 200),
+                ("/users/42", 200),
+                ("/orders", 201),
+                ("/orders/99", 200),
+            ])
+            with open(journal_path_for(report_path), encoding="utf-8") as handle:
+                completed = [json.loads(line)["index"] for line in handle]
+            self.assertNotEqual(completed, sorted(completed))
+
+            runner = os.path.join(tmpdir, ".api-test-runner", "generated_runner.py")
+            generate_runner(plan, config, "python", runner, report_path, os.path.join(tmpdir, "artifacts"))
+            subprocess.run([sys.executable, runner], check=True, capture_output=True)
+            with open(report_path[:-3] + ".json", encoding="utf-8") as handle:
+                reported = [item["index"] for item in json.load(handle)["results"]]
+            self.assertEqual(reported, list(range(1, len(plan) + 1)))
+            with open(report_path, encoding="utf-8") as handle:
+                rows = [line.split(" | ")[1] for line in handle if line.startswith("| GET") or line.startswith("| POST")]
+            self.assertEqual(rows, [ep["path"].replace("{id}", "42" if "users" in ep["path"] else "99") for ep in plan])
+
+    def test_ids_are_scoped_to_their_resource(self):
+        plan = build_plan([
+            {"method": "POST", "path": "/users"},
+            {"method": "POST", "path": "/orders"},
+            {"method": "GET", "path": "/users/{id}"},
+            {"method": "GET", "path": "/users/:userId/orders/{id}"},
+            {"method": "GET", "path": "/items/{id}"},
+        ], {})
+        with tempfile.TemporaryDirectory() as tmpdir:
+            report_path = os.path.join(tmpdir, "reports", "api-test-report.md")
+            config = {"baseUrl": self.base_url, "retries": 0}
+            results = Engine(plan, config, report_path, os.path.join(tmpdir, "artifacts")).run()
+        self.assertEqual(
+            [r["path"] for r in results],
+            ["/users", "/orders", "/users/42", "/users/42/orders/99", "/items/{id}"],
+        )
+        self.assertEqual(results[3]["template"], "/users/:userId/orders/{id}")
+
+    def test_redirects_reuse_and_stale_reconnect(self):
+        plan = [
+            {"method": "GET", "path": "/old"},
+            {"method": "GET", "path": "/health"},
+            {"method": "GET", "path": "/drop"},
+            {"method": "GET", "path": "/health"},
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            report_path = os.path.join(tmpdir, "reports", "api-test-report.md")
+            config = {"baseUrl": self.base_url, "retries": 0, "recordConnectionReuse": True}
+            results = Engine(plan, config, report_path, os.path.join(tmpdir, "artifacts")).run()
+            self.assertEqual([r["status"] for r in results], [200, 200, 200, 200])
+            self.assertEqual([r["connection_reused"] for r in results], [True, True, True, False])
+
+    def test_http_proxy_from_environment(self):
+        Handler.proxied.clear()
+        plan = [{"method": "GET", "path": "/health"}]
+        with tempfile.TemporaryDirectory() as tmpdir, mock.patch.dict(
+            os.environ, {"http_proxy": self.base_url, "HTTP_PROXY": self.base_url, "no_proxy": "", "NO_PROXY": ""}
+        ):
+            report_path = os.path.join(tmpdir, "reports", "api-test-report.md")
+            config = {"baseUrl": "http://api.example.invalid", "retries": 0}
+            results = Engine(plan, config, report_path, os.path.join(tmpdir, "artifacts")).run()
+        self.assertEqual(results[0]["status"], 200)
+        self.assertEqual(Handler.proxied, ["http://api.example.invalid/health"])
+
+    def test_retry_after_and_circuit_breaker(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            report_path = os.path.join(tmpdir, "reports", "api-test-report.md")
+            artifacts_dir = os.path.join(tmpdir, "artifacts")
+            plan = [{"method": "GET", "path": "/flaky"}]
+            config = {"baseUrl": self.base_url, "retries": 1, "retryBackoffMs": 10, "retryBackoffMaxMs": 10}
+            began = time.monotonic()
+            results = Engine(plan, config, report_path, artifacts_dir).run()
+            self.assertEqual(results[0]["status"], 200)
+            self.assertGreaterEqual(time.monotonic() - began, 0.9)
+
+            with socket.socket() as probe:
+                probe.bind(("127.0.0.1", 0))
+                dead_url = f"http://127.0.0.1:{probe.getsockname()[1]}"
+            plan = [{"method": "GET", "path": f"/r{i}"} for i in range(5)]
+            config = {"baseUrl": dead_url, "retries": 0, "breakerThreshold": 2}
+            results = Engine(plan, config, report_path, artifacts_dir).run()
+            self.assertEqual([r.get("skipped", False) for r in results], [False, False, True, True, True])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,11 @@
 import os
 import sys
+import tempfile
 import unittest
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
 
-from api_test_runner.discovery.env import extract_base_url, parse_env_text
+from api_test_runner.discovery.env import extract_base_url, parse_env_file, parse_env_text
 
 
 class TestEnvParsing(unittest.TestCase):
@@ -17,6 +18,15 @@ class TestEnvParsing(unittest.TestCase):
         base = extract_base_url({"HOST": "127.0.0.1", "PORT": "4000"})
         self.assertEqual(base, "http://127.0.0.1:4000")
 
+    def test_parse_env_file_streams_past_old_cap(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, ".env")
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.write("# padding\n" * 100000)
+                handle.write("PORT=9000\n")
+            self.assertGreater(os.path.getsize(path), 512 * 1024)
+            self.assertEqual(parse_env_file(path), {"PORT": "9000"})
+
 
 if __name__ == "__main__":
     unittest.main()
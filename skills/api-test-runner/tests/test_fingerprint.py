@@ -0,0 +1,60 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from api_test_runner.generation import fingerprint as fingerprint_module
+from api_test_runner.generation.fingerprint import compute_fingerprint, fingerprint_matches, save_fingerprint
+from api_test_runner.inventory import build_inventory
+
+
+class TestPlanFingerprint(unittest.TestCase):
+    def write(self, path, text):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(text)
+
+    def test_plan_fingerprint(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = os.path.join(tmpdir, "src", "a.ts")
+            runner = os.path.join(tmpdir, ".api-test-runner", "generated_runner.py")
+            self.write(source, "router.get('/a', handler)\n")
+            self.write(runner, "")
+            self.write(os.path.join(tmpdir, ".api-test-runner", "generated_runner.plan.jsonl"), "{}\n")
+            self.write(os.path.join(tmpdir, "README.md"), "docs\n")
+            config = {"baseUrl": "http://localhost:8080"}
+
+            fingerprint = compute_fingerprint(build_inventory(tmpdir), config, "python", {})
+            save_fingerprint(tmpdir, fingerprint, "python", runner)
+            self.assertTrue(fingerprint_matches(tmpdir, fingerprint, runner))
+
+            self.write(os.path.join(tmpdir, "README.md"), "more docs\n")
+            self.assertEqual(compute_fingerprint(build_inventory(tmpdir), config, "python", {}), fingerprint)
+
+            other = compute_fingerprint(build_inventory(tmpdir), {"baseUrl": "http://other"}, "python", {})
+            self.assertFalse(fingerprint_matches(tmpdir, other, runner))
+
+            self.write(source, "router.get('/changed', handler)\n")
+            os.utime(source, (1, 1))
+            changed = compute_fingerprint(build_inventory(tmpdir), config, "python", {})
+            self.assertNotEqual(changed, fingerprint)
+
+    def test_package_code_changes_fingerprint(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            inventory = build_inventory(tmpdir)
+            before = compute_fingerprint(inventory, {}, "python", {})
+            original = fingerprint_module._package_digest
+            fingerprint_module._package_digest = "0" * 64
+            try:
+                after = compute_fingerprint(inventory, {}, "python", {})
+            finally:
+                fingerprint_module._package_digest = original
+            self.assertNotEqual(before, after)
+            self.assertEqual(fingerprint_module.package_digest(), original)
+
+
+
+if __name__ == "__main__":
+    unittest.main()
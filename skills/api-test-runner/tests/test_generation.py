@@ -0,0 +1,35 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from api_test_runner.generation.runner import generate_runner, plan_path_for
+
+
+class TestGeneration(unittest.TestCase):
+    def test_plan_sidecar(self):
+        plan = [
+            {"method": "GET", "path": "/health"},
+            {"method": "POST", "path": "/notes", "payload": {"text": "it's \"quoted\""}},
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            runner = os.path.join(tmpdir, ".api-test-runner", "generated_runner.py")
+            generate_runner(plan, {"baseUrl": "http://localhost:8080"}, "python", runner, "report.md", "artifacts")
+
+            with open(runner, "r", encoding="utf-8") as handle:
+                source = handle.read()
+            self.assertNotIn("/notes", source)
+            compile(source, runner, "exec")
+
+            with open(plan_path_for(runner), "r", encoding="utf-8") as handle:
+                lines = [json.loads(line) for line in handle]
+            self.assertEqual(lines[0]["config"]["baseUrl"], "http://localhost:8080")
+            self.assertEqual(lines[0]["entries"], 2)
+            self.assertEqual(lines[1:], plan)
+
+
+if __name__ == "__main__":
+    unittest.main()
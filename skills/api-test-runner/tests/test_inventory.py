@@ -0,0 +1,48 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from api_test_runner.inventory import build_inventory
+
+
+class TestInventory(unittest.TestCase):
+    def test_index_and_prune(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for rel in ["src/app.ts", "src/.env", "node_modules/pkg/index.js", "vendor/lib.js"]:
+                path = os.path.join(tmpdir, rel)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, "w", encoding="utf-8") as handle:
+                    handle.write("x")
+
+            inventory = build_inventory(tmpdir)
+            self.assertEqual(inventory.find([".env"]), [os.path.join(tmpdir, "src", ".env")])
+            names = sorted(os.path.basename(p) for p in inventory.find_by_ext({".js", ".ts"}))
+            self.assertEqual(names, ["app.ts", "lib.js"])
+
+            pruned = build_inventory(tmpdir, ["vendor"])
+            self.assertIn("index.js", [os.path.basename(p) for p in pruned.find_by_ext({".js"})])
+            self.assertNotIn("lib.js", [os.path.basename(p) for p in pruned.find_by_ext({".js"})])
+            self.assertEqual(pruned.get(os.path.join(tmpdir, "src", "app.ts")).size, 1)
+
+    def test_lookups_use_indexes_in_inventory_order(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for rel in ["a/openapi.json", "b/swagger.yaml", "c/openapi.json", "c/app.ts", "d/x.js"]:
+                path = os.path.join(tmpdir, rel)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, "w", encoding="utf-8") as handle:
+                    handle.write("x")
+
+            inventory = build_inventory(tmpdir)
+            order = [entry.path for entry in inventory.entries]
+            inventory.entries = []
+            specs = inventory.find(["swagger.yaml", "openapi.json", "missing"])
+            self.assertEqual([os.path.relpath(p, tmpdir) for p in specs], ["a/openapi.json", "b/swagger.yaml", "c/openapi.json"])
+            sources = inventory.find_by_ext([".js", ".ts"])
+            self.assertEqual(sources, [path for path in order if path.endswith((".js", ".ts"))])
+
+
+if __name__ == "__main__":
+    unittest.main()
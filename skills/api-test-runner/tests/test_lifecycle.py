@@ -0,0 +1,96 @@
+import json
+import os
+import socket
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from api_test_runner.execution import BackendProcess, BackendStartError, infer_start_command, resolve_health_path
+from api_test_runner.execution.lifecycle import write_lifecycle
+from api_test_runner.reporting import lifecycle_path_for, load_lifecycle, rebuild_reports
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestStartCommand(unittest.TestCase):
+    def write(self, path, text):
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(text)
+
+    def test_infer_start_command(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.assertIsNone(infer_start_command(tmpdir, {}))
+            self.write(os.path.join(tmpdir, "docker-compose.yml"), "services: {}\n")
+            spec = infer_start_command(tmpdir, {})
+            self.assertEqual(spec["command"], "docker compose -f docker-compose.yml up")
+            self.assertEqual(spec["stopCommand"], "docker compose -f docker-compose.yml down")
+            self.write(os.path.join(tmpdir, "Makefile"), "VAR := 1\nbuild:\n\techo\nserve: build\n\techo\n")
+            self.assertEqual(infer_start_command(tmpdir, {})["command"], "make serve")
+            self.write(os.path.join(tmpdir, "package.json"), json.dumps({"scripts": {"start": "node a", "dev": "node b"}}))
+            self.assertEqual(infer_start_command(tmpdir, {})["command"], "npm run dev")
+            spec = infer_start_command(tmpdir, {"start": {"command": "./run.sh", "port": 9000}})
+            self.assertEqual(spec, {"command": "./run.sh", "port": 9000})
+
+    def test_resolve_health_path(self):
+        plan = [
+            {"method": "GET", "path": "/health/{id}"},
+            {"method": "POST", "path": "/health"},
+            {"method": "GET", "path": "/actuator/health"},
+        ]
+        self.assertEqual(resolve_health_path({}, plan), "/actuator/health")
+        self.assertEqual(resolve_health_path({"start": {"healthPath": "/ready"}}, plan), "/ready")
+        self.assertIsNone(resolve_health_path({}, plan[:2]))
+
+
+class TestBackendProcess(unittest.TestCase):
+    def test_start_ready_stop(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            port = free_port()
+            spec = {"command": f"{sys.executable} -m http.server {port} --bind 127.0.0.1", "readyTimeoutSeconds": 20}
+            backend = BackendProcess(tmpdir, spec, f"http://127.0.0.1:{port}", "/")
+            with backend:
+                metrics = backend.wait_ready()
+                self.assertGreater(metrics["cold_start_ms"], 0)
+                self.assertGreaterEqual(metrics["time_to_ready_ms"], metrics["cold_start_ms"])
+                self.assertEqual(metrics["health_url"], f"http://127.0.0.1:{port}/")
+            self.assertIn("stop_ms", backend.metrics)
+            self.assertIsNotNone(backend.metrics["exit_code"])
+            self.assertIsNone(backend.process)
+            self.assertTrue(os.path.exists(os.path.join(tmpdir, ".api-test-runner", "backend.log")))
+
+    def test_exit_before_ready(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            backend = BackendProcess(tmpdir, {"command": "echo boom; exit 3"}, f"http://127.0.0.1:{free_port()}")
+            backend.start()
+            with self.assertRaises(BackendStartError) as ctx:
+                backend.wait_ready(timeout=10)
+            backend.stop()
+            self.assertIn("code 3", str(ctx.exception))
+            self.assertIn("boom", str(ctx.exception))
+
+    def test_lifecycle_in_reports(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            report_path = os.path.join(tmpdir, "report.md")
+            journal = os.path.join(tmpdir, "report.journal.jsonl")
+            with open(journal, "w", encoding="utf-8") as handle:
+                handle.write(json.dumps({"index": 0, "method": "GET", "path": "/health", "status": 200, "ok": True}) + "\n")
+            metrics = {"command": "npm run dev", "pid": 1, "cold_start_ms": 12.5, "time_to_ready_ms": 30.0, "stop_ms": 4.0}
+            write_lifecycle(lifecycle_path_for(report_path), metrics)
+            self.assertEqual(load_lifecycle(report_path), metrics)
+            rebuild_reports(journal, report_path)
+            with open(report_path, encoding="utf-8") as handle:
+                markdown = handle.read()
+            self.assertIn("## Backend Lifecycle", markdown)
+            self.assertIn("30.0", markdown)
+            with open(os.path.join(tmpdir, "report.json"), encoding="utf-8") as handle:
+                self.assertEqual(json.load(handle)["lifecycle"]["cold_start_ms"], 12.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
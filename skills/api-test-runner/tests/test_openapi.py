@@ -0,0 +1,127 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from api_test_runner.cache import open_cache
+from api_test_runner.cli import build_plan
+from api_test_runner.discovery import OpenApiIndex, discover_endpoints, example_payload, load_openapi_indexes
+from api_test_runner.discovery import openapi
+from api_test_runner.discovery.openapi import synthesize
+
+SPEC = {
+    "openapi": "3.0.0",
+    "paths": {
+        "/users": {"post": {"requestBody": {"$ref": "#/components/requestBodies/NewUser"}}},
+        "/users/{id}": {"put": {"requestBody": {"content": {"application/json": {"schema": {"$ref": "#/components/schemas/User"}}}}}},
+        "/nodes": {"post": {"requestBody": {"content": {"application/vnd.api+json": {"schema": {"$ref": "#/components/schemas/Node"}}}}}},
+        "/plain": {"post": {"responses": {}}},
+    },
+    "components": {
+        "requestBodies": {
+            "NewUser": {"content": {"application/json": {"schema": {"$ref": "#/components/schemas/NewUser"}}}}
+        },
+        "schemas": {
+            "NewUser": {"allOf": [{"$ref": "#/components/schemas/User"}, {"required": ["age"], "properties": {"age": {"type": "integer", "minimum": 18}}}]},
+            "User": {
+                "type": "object",
+                "required": ["id", "email", "role", "name", "tags"],
+                "properties": {
+                    "id": {"type": "string", "readOnly": True},
+                    "email": {"type": "string", "format": "email"},
+                    "role": {"$ref": "#/components/schemas/Role"},
+                    "name": {"type": "string", "minLength": 8, "maxLength": 10},
+                    "tags": {"type": "array", "items": {"type": "string", "format": "uuid"}},
+                    "nickname": {"type": "string"},
+                },
+            },
+            "Role": {"type": "string", "enum": ["admin", "user"]},
+            "Node": {
+                "type": "object",
+                "properties": {
+                    "label": {"type": "string", "example": "root"},
+                    "weight": {"type": "number", "minimum": 0, "exclusiveMinimum": True, "maximum": 0.5},
+                    "children": {"type": "array", "items": {"$ref": "#/components/schemas/Node"}},
+                    "parent": {"$ref": "#/components/schemas/Node"},
+                },
+            },
+            "Unused": {"type": "object", "properties": {"x": {"$ref": "#/components/schemas/Missing"}}},
+        },
+    },
+}
+
+USER = {"email": "user@example.com", "role": "admin", "name": "stringxx", "tags": ["00000000-0000-4000-8000-000000000000"]}
+
+
+class TestOpenApiIndex(unittest.TestCase):
+    def test_payloads_from_schemas(self):
+        index = OpenApiIndex(SPEC)
+        self.assertEqual(index.refs, {})
+        self.assertEqual(example_payload([index], "POST", "/users"), dict(USER, age=18))
+        self.assertEqual(example_payload([index], "PUT", "/users/:id"), USER)
+        self.assertEqual(example_payload([index], "POST", "/nodes"), {"label": "root", "weight": 0.5, "children": []})
+        self.assertIsNone(example_payload([index], "POST", "/plain"))
+        self.assertNotIn("#/components/schemas/Unused", index.refs)
+
+    def test_ref_cycles(self):
+        spec = {"components": {"schemas": {"A": {"$ref": "#/components/schemas/B"}, "B": {"$ref": "#/components/schemas/A"}}}}
+        index = OpenApiIndex(spec)
+        self.assertEqual(index.resolve({"$ref": "#/components/schemas/A"}), {})
+        self.assertEqual(synthesize(index, {"type": "object", "required": ["a"], "properties": {"a": {"$ref": "#/components/schemas/A"}}}), {})
+
+    def test_swagger_body_parameter(self):
+        spec = {
+            "swagger": "2.0",
+            "paths": {"/pets": {"post": {"parameters": [{"in": "body", "name": "pet", "schema": {"$ref": "#/definitions/Pet"}}]}}},
+            "definitions": {"Pet": {"type": "object", "required": ["name"], "properties": {"name": {"type": "string"}}}},
+        }
+        self.assertEqual(example_payload([OpenApiIndex(spec)], "POST", "/pets"), {"name": "string"})
+
+    def test_serialized_index_keeps_reachable_refs(self):
+        data = json.loads(json.dumps(OpenApiIndex(SPEC).to_dict()))
+        self.assertNotIn("#/components/schemas/Unused", data["refs"])
+        restored = OpenApiIndex.from_dict(data)
+        self.assertEqual(example_payload([restored], "POST", "/users"), dict(USER, age=18))
+        self.assertEqual(example_payload([restored], "POST", "/nodes")["label"], "root")
+
+    def test_index_cached_with_discovery(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir, "openapi.json"), "w", encoding="utf-8") as handle:
+                json.dump(SPEC, handle)
+            cache = open_cache(tmpdir)
+            load_openapi_indexes(tmpdir, cache=cache)
+            cache.save()
+            cache = open_cache(tmpdir)
+            indexes = load_openapi_indexes(tmpdir, cache=cache)
+            self.assertEqual(cache.hits, 1)
+            self.assertIsNone(indexes[0].spec)
+            plan = build_plan([{"method": "POST", "path": "/users"}, {"method": "POST", "path": "/other"}], {}, indexes)
+            self.assertEqual(plan[0]["payload"], dict(USER, age=18))
+            self.assertEqual(plan[0]["payload_source"], "openapi")
+            self.assertFalse(plan[0]["payload_guess"])
+            self.assertTrue(plan[1]["payload_guess"])
+
+
+    def test_each_spec_parsed_once_per_discovery(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for name in ("openapi.json", os.path.join("legacy", "swagger.json")):
+                os.makedirs(os.path.dirname(os.path.join(tmpdir, name)), exist_ok=True)
+                with open(os.path.join(tmpdir, name), "w", encoding="utf-8") as handle:
+                    json.dump(SPEC, handle)
+            with mock.patch.object(openapi, "load_spec", wraps=openapi.load_spec) as load_spec:
+                discover_endpoints(tmpdir)
+                indexes = load_openapi_indexes(tmpdir)
+                discover_endpoints(tmpdir)
+            self.assertEqual(sorted(call.args[0] for call in load_spec.call_args_list), sorted(
+                os.path.join(tmpdir, name) for name in ("openapi.json", os.path.join("legacy", "swagger.json"))
+            ))
+            self.assertEqual(len(indexes), 2)
+            self.assertEqual(example_payload(indexes, "POST", "/users"), dict(USER, age=18))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from api_test_runner import profiling
+from api_test_runner.discovery import discover_endpoints
+from api_test_runner.profiling import Profiler, activate, count, stage
+
+
+class TestProfiler(unittest.TestCase):
+    def tearDown(self):
+        activate(None)
+
+    def test_trace_and_summary(self):
+        profiler = Profiler()
+        with profiler.stage("outer"):
+            with profiler.stage("inner"):
+                profiler.count("bytes_read", 10)
+            with profiler.stage("inner"):
+                profiler.count("bytes_read", 5)
+        trace = profiler.trace()
+        spans = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+        self.assertEqual([event["name"] for event in spans], ["outer", "inner", "inner"])
+        self.assertGreaterEqual(spans[0]["dur"], spans[1]["dur"] + spans[2]["dur"])
+        counters = [event for event in trace["traceEvents"] if event["ph"] == "C"]
+        self.assertEqual(counters[-1]["args"], {"bytes_read": 15})
+        summary = profiler.summary()
+        self.assertRegex(summary, r"\n  inner\s+2 ")
+        self.assertRegex(summary, r"bytes_read\s+15")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = profiler.write(tmpdir)
+            self.assertTrue(os.path.exists(paths["trace"]))
+            self.assertTrue(os.path.exists(paths["summary"]))
+
+    def test_inactive_helpers_are_noops(self):
+        with stage("ignored"):
+            count("ignored")
+        self.assertIsNone(profiling._ACTIVE)
+
+    def test_discovery_counters(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir, "app.js"), "w", encoding="utf-8") as handle:
+                handle.write("app.get('/users', h);\napp.post('/users', h);\n")
+            profiler = Profiler()
+            activate(profiler)
+            discover_endpoints(tmpdir)
+            activate(None)
+        self.assertEqual(profiler.counters["route_matches"], 2)
+        self.assertEqual(profiler.counters["source_files_parsed"], 1)
+        self.assertGreater(profiler.counters["bytes_read"], 0)
+        self.assertEqual({event["name"] for event in profiler.events}, {"openapi", "source", "extract"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,18 @@
+import json
 import os
 import sys
+import tempfile
 import unittest
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
 
-from api_test_runner.reporting.report import format_markdown_report
+from api_test_runner.reporting.report import (
+    format_bench_markdown,
+    format_json_report,
+    format_markdown_report,
+    journal_path_for,
+    rebuild_reports,
+)
 
 
 class TestReporting(unittest.TestCase):
@@ -21,6 +29,69 @@ class TestReporting(unittest.TestCase):
             ]
         )
         self.assertIn("| GET | /health | 200 | 10 | ok |", output)
+        self.assertNotIn("Phase Timings", output)
+
+    def test_phase_summary(self):
+        timings = {"dns_ms": 1.0, "connect_ms": 2.0, "tls_ms": 0.0, "ttfb_ms": 4.0, "download_ms": 1.0, "total_ms": 8.0}
+        results = [
+            {"method": "GET", "path": "/a", "status": 200, "latency_ms": 8.0, "notes": "ok", "timings": timings},
+            {"method": "GET", "path": "/b", "status": 200, "latency_ms": 4.0, "notes": "ok", "timings": dict(timings, ttfb_ms=2.0, total_ms=4.0)},
+        ]
+        summary = json.loads(format_json_report(results))["summary"]["phases"]
+        self.assertEqual(summary["ttfb"], {"mean_ms": 3.0, "max_ms": 4.0})
+        self.assertIn("| total | 6.0 | 8.0 |", format_markdown_report(results))
+
+    def test_format_bench_markdown(self):
+        output = format_bench_markdown(
+            {
+                "duration_s": 1.0,
+                "concurrency": 2,
+                "overall": {"requests": 10, "rps": 10.0, "error_rate": 0.1},
+                "endpoints": [
+                    {
+                        "method": "GET",
+                        "path": "/health",
+                        "requests": 10,
+                        "rps": 10.0,
+                        "errors": 1,
+                        "p50_ms": 1.5,
+                        "p90_ms": 2.0,
+                        "p99_ms": 3.0,
+                        "max_ms": 3.1,
+                    }
+                ],
+            }
+        )
+        self.assertIn("requests: 10, rps: 10.0, error rate: 0.1", output)
+        self.assertIn("| GET | /health | 10 | 10.0 | 1 | 1.5 | 2.0 | 3.0 | 3.1 |", output)
+
+    def test_rebuild_from_partial_journal(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            report_path = os.path.join(tmpdir, "reports", "api-test-report.md")
+            journal = journal_path_for(report_path)
+            self.assertTrue(journal.endswith("api-test-report.journal.jsonl"))
+            os.makedirs(os.path.dirname(journal))
+            rows = [{"method": "GET", "path": f"/r{i}", "status": 200, "latency_ms": i, "notes": "ok"} for i in range(3)]
+            with open(journal, "w", encoding="utf-8") as handle:
+                for row in rows:
+                    handle.write(json.dumps(row) + "\n")
+                handle.write('{"method": "GET", "pa')
+            self.assertEqual(rebuild_reports(journal, report_path), 3)
+            with open(report_path, encoding="utf-8") as handle:
+                self.assertEqual(handle.read(), format_markdown_report(rows))
+            with open(report_path[:-3] + ".json", encoding="utf-8") as handle:
+                self.assertEqual(json.load(handle)["results"], rows)
+
+
+    def test_rebuild_orders_by_plan_index(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            report_path = os.path.join(tmpdir, "api-test-report.md")
+            rows = [{"index": i, "method": "GET", "path": f"/r{i}", "status": 200, "latency_ms": 1, "notes": "ok"} for i in (1, 3, 2)]
+            with open(journal_path_for(report_path), "w", encoding="utf-8") as handle:
+                handle.writelines(json.dumps(row) + "\n" for row in rows)
+            rebuild_reports(journal_path_for(report_path), report_path)
+            with open(report_path[:-3] + ".json", encoding="utf-8") as handle:
+                self.assertEqual([item["index"] for item in json.load(handle)["results"]], [1, 2, 3])
 
 
 if __name__ == "__main__":
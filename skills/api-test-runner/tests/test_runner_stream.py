@@ -0,0 +1,94 @@
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from api_test_runner.artifacts import read_artifact
+from api_test_runner.execution import Engine
+
+BIG_BODY = json.dumps({"id": 5, "items": ["x" * 100] * 200}).encode("utf-8")
+
+DOCUMENTS = [
+    {"id": 1, "name": "a"},
+    {"userId": "u-1", "nested": {"id": 9, "tags": ["{", "}", "[", "]"]}, "orderID": 3.5},
+    {"text": "quote \" and brace } inside", "id": "esc\\\"aped", "flagId": True, "emptyId": None},
+    {"list": [[{"id": 1}], {"deep": {"deeper": ["\"}"]}}], "sessionId": "séssion-☃"},
+    {"objId": {"id": 2}, "arrId": [1, 2], "id": -12e3},
+]
+
+
+def expected_ids(document):
+    return {
+        key: value
+        for key, value in document.items()
+        if key.lower().endswith("id") and not isinstance(value, (dict, list))
+    }
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BIG_BODY)))
+        self.end_headers()
+        self.wfile.write(BIG_BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestRunnerStreaming(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.report_path = os.path.join(self.tmpdir.name, "reports", "api-test-report.md")
+        self.artifacts_dir = os.path.join(self.tmpdir.name, "artifacts")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_id_scanner_matches_json_loads_for_any_split(self):
+        scanner_class = Engine([], {}, self.report_path, self.artifacts_dir).load()["TopLevelIdScanner"]
+        for document in DOCUMENTS:
+            data = json.dumps(document, ensure_ascii=False).encode("utf-8")
+            for split in range(len(data) + 1):
+                scanner = scanner_class()
+                scanner.feed(data[:split])
+                scanner.feed(data[split:])
+                self.assertEqual(scanner.ids, expected_ids(document), (document, split))
+            scanner = scanner_class()
+            for offset in range(len(data)):
+                scanner.feed(data[offset:offset + 1])
+            self.assertEqual(scanner.ids, expected_ids(document))
+
+    def test_capture_limit_truncates_but_digest_covers_body(self):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            config = {
+                "baseUrl": f"http://127.0.0.1:{server.server_address[1]}",
+                "retries": 0,
+                "captureLimitBytes": 1000,
+            }
+            plan = [{"method": "GET", "path": "/big"}, {"method": "GET", "path": "/big/{id}"}]
+            results = Engine(plan, config, self.report_path, self.artifacts_dir).run()
+        finally:
+            server.shutdown()
+            server.server_close()
+        self.assertEqual(results[1]["path"], "/big/5")
+        artifact = read_artifact(self.artifacts_dir, 1)
+        self.assertEqual(artifact["response_size"], len(BIG_BODY))
+        self.assertEqual(artifact["response_sha256"], hashlib.sha256(BIG_BODY).hexdigest())
+        self.assertTrue(artifact["response_truncated"])
+        self.assertEqual(len(artifact["response"].encode("utf-8")), 1000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from api_test_runner.artifacts import iter_artifacts, merge_artifacts, read_artifact
+from api_test_runner.cli import build_plan
+from api_test_runner.execution import Engine
+from api_test_runner.planning import load_latencies, parse_shard, shard_plan
+from api_test_runner.reporting import merge_results, write_merged_report
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def respond(self):
+        data = json.dumps({"id": 7, "path": self.path}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = respond
+    do_POST = respond
+
+    def log_message(self, *args):
+        pass
+
+
+def sample_plan():
+    endpoints = [{"method": "GET", "path": "/health"}]
+    for name in ("users", "orders", "items", "tags", "carts"):
+        endpoints.append({"method": "POST", "path": f"/{name}"})
+        endpoints.append({"method": "GET", "path": f"/{name}/{{id}}"})
+    return build_plan(endpoints, {})
+
+
+class TestShardPlan(unittest.TestCase):
+    def test_parse_shard(self):
+        self.assertEqual(parse_shard("2/4"), (2, 4))
+        for bad in ("0/4", "5/4", "1/0", "2-4", ""):
+            with self.assertRaises(ValueError):
+                parse_shard(bad)
+
+    def test_shards_partition_plan_by_resource(self):
+        plan = sample_plan()
+        shards = [shard_plan(plan, index, 3) for index in (1, 2, 3)]
+        for shard in shards:
+            self.assertEqual(shard[0]["path"], "/health")
+            self.assertEqual(shard[0]["index"], 1)
+            self.assertEqual([ep["index"] for ep in shard], sorted(ep["index"] for ep in shard))
+        work = [ep["index"] for shard in shards for ep in shard if not ep.get("setup")]
+        self.assertEqual(sorted(work), list(range(2, len(plan) + 1)))
+        owners = {}
+        for number, shard in enumerate(shards):
+            for ep in shard:
+                if not ep.get("setup"):
+                    self.assertEqual(owners.setdefault(ep["group"], number), number)
+        self.assertEqual(shards, [shard_plan(plan, index, 3) for index in (1, 2, 3)])
+
+    def test_recorded_latencies_balance_shards(self):
+        plan = sample_plan()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "api-test-report.json")
+            results = [{"method": "POST", "template": "/users", "status": 201, "latency_ms": 900}]
+            results += [{"method": "GET", "template": f"/{name}/{{id}}", "status": 200, "latency_ms": 10} for name in ("orders", "items", "tags", "carts")]
+            with open(path, "w", encoding="utf-8") as handle:
+                json.dump({"results": results}, handle)
+            latencies = load_latencies([path, os.path.join(tmpdir, "missing.json")])
+        first, second = shard_plan(plan, 1, 2, latencies), shard_plan(plan, 2, 2, latencies)
+        self.assertEqual({ep["group"] for ep in first if not ep.get("setup")}, {"users"})
+        self.assertEqual({ep["group"] for ep in second if not ep.get("setup")}, {"orders", "items", "tags", "carts"})
+
+    def test_shared_api_prefix_is_skipped(self):
+        endpoints = [{"method": "GET", "path": "/api/v1/health"}]
+        for name in ("users", "orders", "items", "tags"):
+            endpoints.append({"method": "POST", "path": f"/api/v1/{name}"})
+            endpoints.append({"method": "GET", "path": f"/api/v1/{name}/{{id}}"})
+        endpoints.append({"method": "GET", "path": "/api/v1/users/{userId}/orders"})
+        plan = build_plan(endpoints, {})
+        shards = [shard_plan(plan, index, 2) for index in (1, 2)]
+        work = [[ep["path"] for ep in shard if not ep.get("setup")] for shard in shards]
+        self.assertTrue(all(work))
+        self.assertEqual(sorted(len(paths) for paths in work), [4, 5])
+        users = next(paths for paths in work if "/api/v1/users" in paths)
+        self.assertIn("/api/v1/users/{id}", users)
+        self.assertIn("/api/v1/users/{userId}/orders", users)
+
+
+class TestShardMerge(unittest.TestCase):
+    def test_merged_shards_match_plan_order(self):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        plan = sample_plan()
+        config = {"baseUrl": f"http://127.0.0.1:{server.server_address[1]}", "retries": 0}
+        try:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                reports, sources = [], []
+                for index in (1, 2):
+                    label = f"{index}-of-2"
+                    report_path = os.path.join(tmpdir, "reports", "shards", label, "api-test-report.md")
+                    artifacts_dir = os.path.join(tmpdir, "artifacts", "shards", label)
+                    results = Engine(shard_plan(plan, index, 2), config, report_path, artifacts_dir).run()
+                    self.assertIn("/health", [item["path"] for item in results])
+                    reports.append({"results": results})
+                    sources.append(artifacts_dir)
+
+                merged = merge_results(reports)
+                self.assertEqual([item["index"] for item in merged], list(range(1, len(plan) + 1)))
+                self.assertEqual([item["template"] for item in merged], [ep["path"] for ep in plan])
+                self.assertIn("/users/7", [item["path"] for item in merged])
+
+                report_path = os.path.join(tmpdir, "reports", "api-test-report.md")
+                self.assertEqual(write_merged_report(merged, report_path), len(plan))
+                with open(report_path[:-3] + ".json", "r", encoding="utf-8") as handle:
+                    self.assertEqual(len(json.load(handle)["results"]), len(plan))
+
+                target = os.path.join(tmpdir, "artifacts")
+                self.assertEqual(merge_artifacts(sources, target), len(plan))
+                self.assertEqual([record["index"] for record in iter_artifacts(target)], list(range(1, len(plan) + 1)))
+                self.assertEqual(read_artifact(target, 3)["path"], plan[2]["path"].replace("{id}", "7"))
+        finally:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
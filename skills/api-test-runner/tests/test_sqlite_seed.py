@@ -0,0 +1,107 @@
+import contextlib
+import io
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from api_test_runner.discovery import detect_db_engine, parse_db_url
+from api_test_runner.execution import Engine
+
+SEED_SQL = """
+CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT);
+INSERT INTO users (name) VALUES ('semi;colon');
+"""
+
+
+class TestSqliteUrls(unittest.TestCase):
+    def test_parse_sqlite_urls(self):
+        self.assertEqual(parse_db_url("sqlite:///data/app.db"), {"engine": "sqlite", "database": "data/app.db"})
+        self.assertEqual(parse_db_url("sqlite:////var/app.db")["database"], "/var/app.db")
+        self.assertEqual(parse_db_url("jdbc:sqlite:app.sqlite")["database"], "app.sqlite")
+        self.assertEqual(parse_db_url("file:./dev.db?connection_limit=1")["database"], "./dev.db")
+        self.assertEqual(parse_db_url("sqlite://")["database"], ":memory:")
+        self.assertEqual(parse_db_url("postgres://db:5432/app")["engine"], "postgres")
+        self.assertEqual(detect_db_engine({"database": "local.sqlite3"}), "sqlite")
+
+
+class TestSqliteSeed(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, "app.db")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def runner(self, **extra):
+        config = {
+            "db": {"engine": "sqlite", "database": self.db_path},
+            "seedSql": SEED_SQL,
+            "seedRows": {"users": [{"name": "b"}, {"name": "c"}]},
+            "stateDir": os.path.join(self.tmpdir.name, "state"),
+            "inspectDb": True,
+        }
+        config.update(extra)
+        report = os.path.join(self.tmpdir.name, "reports", "report.md")
+        return Engine([], config, report, os.path.join(self.tmpdir.name, "artifacts")).load()
+
+    def names(self):
+        with contextlib.closing(sqlite3.connect(self.db_path)) as conn:
+            return [row[0] for row in conn.execute("SELECT name FROM users ORDER BY id")]
+
+    def call(self, namespace, name):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            namespace[name]()
+        return out.getvalue()
+
+    def test_seed_then_restore_snapshot(self):
+        output = self.call(self.runner(), "run_seed")
+        self.assertIn("Seeded SQLite in-process", output)
+        self.assertEqual(self.names(), ["semi;colon", "b", "c"])
+        self.assertEqual(len(os.listdir(os.path.join(self.tmpdir.name, "state"))), 1)
+
+        with contextlib.closing(sqlite3.connect(self.db_path)) as conn:
+            conn.execute("DELETE FROM users WHERE name = 'b'")
+            conn.execute("CREATE TABLE extra (id INTEGER)")
+            conn.commit()
+        output = self.call(self.runner(), "run_seed")
+        self.assertIn("Restored SQLite seed snapshot", output)
+        self.assertEqual(self.names(), ["semi;colon", "b", "c"])
+
+        self.call(self.runner(seedSql="", seedRows={"users": [{"name": "d"}]}, dbSnapshot=False), "run_seed")
+        self.assertEqual(self.names(), ["semi;colon", "b", "c", "d"])
+
+    def test_engine_snapshot_defaults_next_to_report(self):
+        templates = os.path.join(os.path.dirname(__file__), "..", "templates")
+        before = sorted(os.listdir(templates))
+        config = {"db": {"engine": "sqlite", "database": self.db_path}, "seedSql": SEED_SQL}
+        report = os.path.join(self.tmpdir.name, "reports", "report.md")
+        namespace = Engine([], config, report, os.path.join(self.tmpdir.name, "artifacts")).load()
+        self.assertIn("Seeded SQLite in-process", self.call(namespace, "run_seed"))
+        self.assertEqual(sorted(os.listdir(templates)), before)
+        state = os.listdir(os.path.join(self.tmpdir.name, "reports", ".api-test-runner"))
+        self.assertEqual(len([name for name in state if name.startswith("sqlite-seed-")]), 1)
+
+    def test_seed_is_one_transaction(self):
+        output = self.call(self.runner(seedRows={"missing": [{"name": "x"}]}), "run_seed")
+        self.assertIn("DB seed failed", output)
+        with contextlib.closing(sqlite3.connect(self.db_path)) as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()[0], 0)
+        self.assertFalse(os.path.exists(os.path.join(self.tmpdir.name, "state")))
+
+    def test_inspect_uses_sqlite_master(self):
+        namespace = self.runner()
+        self.call(namespace, "run_seed")
+        self.call(namespace, "run_inspect")
+        with open(os.path.join(self.tmpdir.name, "artifacts", "db-inspect.txt"), encoding="utf-8") as handle:
+            text = handle.read()
+        self.assertIn("table users (3 rows)", text)
+        self.assertIn("CREATE TABLE users", text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from api_test_runner.discovery import discover_endpoints
+from api_test_runner.planning import compile_path, template_key
+
+
+class TestPathTemplates(unittest.TestCase):
+    def test_compile_path(self):
+        self.assertEqual(
+            compile_path("/users/{userId}/orders/:id"),
+            {
+                "parts": ["/users/", "/orders/", ""],
+                "slots": [["users", ["userId", "id"], "{userId}"], ["orders", ["id"], ":id"]],
+                "resource": "orders",
+            },
+        )
+        self.assertEqual(compile_path("/users"), {"parts": ["/users"], "slots": [], "resource": "users"})
+        self.assertEqual(compile_path("/users/{id}/avatar")["resource"], "avatar")
+        self.assertEqual(compile_path("/{id}")["slots"], [["", ["id"], "{id}"]])
+
+    def test_template_key(self):
+        self.assertEqual(template_key("/users/{id}/orders/:orderId"), "/users/{}/orders/{}")
+        self.assertEqual(template_key("/users/:id"), template_key("/users/{userId}"))
+
+    def test_discovery_dedupes_param_styles(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir, "openapi.json"), "w", encoding="utf-8") as handle:
+                handle.write('{"paths": {"/users/{id}": {"get": {}}, "/users": {"get": {}}}}')
+            with open(os.path.join(tmpdir, "app.js"), "w", encoding="utf-8") as handle:
+                handle.write("app.get('/users/:id', h);\napp.put('/users/:id', h);\n")
+            endpoints = discover_endpoints(tmpdir)
+        self.assertEqual(
+            sorted((ep["method"], ep["path"]) for ep in endpoints),
+            [("GET", "/users"), ("GET", "/users/:id"), ("PUT", "/users/:id")],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
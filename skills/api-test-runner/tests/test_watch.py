@@ -0,0 +1,78 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from api_test_runner.cli import build_plan
+from api_test_runner.watch import SourceMap, Watcher, select_affected
+
+
+def write(root, relpath, text, bump=0):
+    path = os.path.join(root, relpath)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.write(text)
+    if bump:
+        stat = os.stat(path)
+        os.utime(path, (stat.st_atime, stat.st_mtime + bump))
+    return path
+
+
+class TestSelectAffected(unittest.TestCase):
+    def test_includes_setup_and_create_dependencies(self):
+        endpoints = [
+            {"method": "GET", "path": "/health"},
+            {"method": "POST", "path": "/users"},
+            {"method": "GET", "path": "/users/{id}"},
+            {"method": "POST", "path": "/users/{id}/orders"},
+            {"method": "GET", "path": "/users/{userId}/orders/{orderId}"},
+            {"method": "GET", "path": "/tags"},
+        ]
+        selected = select_affected(endpoints, {("GET", "/users/{}/orders/{}")})
+        self.assertEqual(
+            [ep["path"] for ep in selected],
+            ["/health", "/users", "/users/{id}/orders", "/users/{userId}/orders/{orderId}"],
+        )
+        self.assertEqual(select_affected(endpoints, {("GET", "/missing")}), [])
+
+
+class TestWatcher(unittest.TestCase):
+    def test_reruns_only_endpoints_of_changed_files(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            write(tmpdir, "openapi.json", json.dumps({"paths": {"/health": {"get": {}}, "/orders": {"post": {}}}}))
+            items = write(tmpdir, "src/items.js", "router.post('/items', h);\n")
+            source_map = SourceMap(tmpdir)
+            files = source_map.load()
+            executed = []
+
+            def execute(plan):
+                executed.append([(ep["method"], ep["path"]) for ep in plan])
+                return [dict(ep, template=ep["path"], status=500 if "widgets" in ep["path"] else 200) for ep in plan]
+
+            watcher = Watcher(source_map, {}, lambda endpoints: build_plan(endpoints, {}, source_map.indexes()), execute)
+            first = watcher.cycle(files)
+            self.assertEqual(len(first["results"]), 3)
+            self.assertIsNone(watcher.cycle())
+
+            write(tmpdir, "src/items.js", "router.post('/items', h);\nrouter.get('/items/:id', h);\nrouter.get('/widgets', h);\n", bump=5)
+            second = watcher.cycle()
+            self.assertEqual(second["changed"], [items])
+            self.assertEqual(
+                executed[-1],
+                [("GET", "/health"), ("POST", "/items"), ("GET", "/items/:id"), ("GET", "/widgets")],
+            )
+            self.assertEqual([item["path"] for item in watcher.failing()], ["/widgets"])
+
+            os.remove(items)
+            third = watcher.cycle()
+            self.assertEqual(sorted(item["path"] for item in third["removed"]), ["/items", "/items/:id", "/widgets"])
+            self.assertEqual(third["results"], [])
+            self.assertEqual(watcher.failing(), [])
+            self.assertEqual(len(watcher.latest), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()